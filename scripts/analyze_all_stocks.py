@@ -5,31 +5,135 @@ Script to analyze all stock Excel files systematically
 
 import os
 import sys
-import time
+import json
+import hashlib
 import logging
+import logging.handlers
 import argparse
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
+from typing import Dict, List, Optional
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from multibagger.stock_analyzer import analyze_stock_workbook
+DEFAULT_CACHE_DIR = Path(__file__).parent.parent / ".cache" / "analysis"
 
-def setup_logging():
+def setup_logging(quiet: bool = False):
     """Setup logging for the analysis process"""
     log_dir = Path(__file__).parent.parent / "logs"
     log_dir.mkdir(exist_ok=True)
     
+    # Batch file writes; errors flush immediately and logging.shutdown()
+    # flushes whatever is left at exit
+    file_handler = logging.FileHandler(log_dir / "bulk_analysis.log")
+    buffered_handler = logging.handlers.MemoryHandler(
+        capacity=1024,
+        flushLevel=logging.ERROR,
+        target=file_handler
+    )
+    
+    stream_handler = logging.StreamHandler(sys.stdout)
+    if quiet:
+        # Only warnings, errors and the closing totals reach the terminal;
+        # the log file keeps INFO
+        stream_handler.addFilter(
+            lambda record: record.levelno >= logging.WARNING or getattr(record, 'summary', False)
+        )
+    
     logging.basicConfig(
         level=logging.INFO,
         format='%(asctime)s - %(levelname)s - %(message)s',
         handlers=[
-            logging.FileHandler(log_dir / "bulk_analysis.log"),
-            logging.StreamHandler(sys.stdout)
+            buffered_handler,
+            stream_handler
         ]
     )
+    # basicConfig only formats the handlers it is given directly
+    file_handler.setFormatter(buffered_handler.formatter)
     return logging.getLogger(__name__)
 
+def flush_log_handlers():
+    """Flush buffered log records to their targets"""
+    for handler in logging.getLogger().handlers:
+        handler.flush()
+
+def file_digest(file_path: str) -> str:
+    """Compute the SHA-256 digest of a file's contents"""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def cached_analyze(excel_path: str, cache_dir: Optional[str]) -> Optional[str]:
+    """
+    Analyze a workbook, reusing the previous report if its content is unchanged.
+    
+    Cache entries are keyed by the SHA-256 of the workbook and invalidated
+    when the analyzer code changes or the cached report no longer exists.
+    """
+    from multibagger.stock_analyzer import analyze_stock_workbook
+    from multibagger.utils import get_analyzer_fingerprint
+    
+    if cache_dir is None:
+        return analyze_stock_workbook(excel_path)
+    
+    entry_path = Path(cache_dir) / f"{file_digest(excel_path)}.json"
+    try:
+        entry = json.loads(entry_path.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        entry = {}
+    
+    cached_path = entry.get('result_path')
+    if (entry.get('analyzer_fingerprint') == get_analyzer_fingerprint()
+            and cached_path and Path(cached_path).exists()):
+        logging.getLogger(__name__).info("Reusing cached report for %s", Path(excel_path).name)
+        return cached_path
+    
+    result_path = analyze_stock_workbook(excel_path)
+    if result_path:
+        # Write to a private temp file first so readers never see a partial entry
+        tmp_path = entry_path.with_name(f"{entry_path.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(
+            json.dumps({'result_path': result_path, 'analyzer_fingerprint': get_analyzer_fingerprint()}),
+            encoding='utf-8'
+        )
+        os.replace(tmp_path, entry_path)
+    
+    return result_path
+
+def analyze_file(excel_path: str, cache_dir: Optional[str]) -> Optional[str]:
+    """Worker entry point: analyze one workbook and flush its buffered logs"""
+    try:
+        return cached_analyze(excel_path, cache_dir)
+    finally:
+        # Pool workers exit without running atexit hooks, so flush per file
+        flush_log_handlers()
+
+def load_manifest(cache_dir: str) -> Dict[str, List]:
+    """Load the per-file (mtime, size, report path) manifest from the last run"""
+    from multibagger.utils import get_analyzer_fingerprint
+    
+    try:
+        manifest = json.loads((Path(cache_dir) / "manifest.json").read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return {}
+    
+    if manifest.get('analyzer_fingerprint') != get_analyzer_fingerprint():
+        return {}
+    return manifest.get('files', {})
+
+def save_manifest(cache_dir: str, files: Dict[str, List]):
+    """Atomically write the per-file manifest"""
+    from multibagger.utils import get_analyzer_fingerprint
+    
+    manifest_path = Path(cache_dir) / "manifest.json"
+    tmp_path = manifest_path.with_name(f"{manifest_path.name}.{os.getpid()}.tmp")
+    tmp_path.write_text(
+        json.dumps({'analyzer_fingerprint': get_analyzer_fingerprint(), 'files': files}),
+        encoding='utf-8'
+    )
+    os.replace(tmp_path, manifest_path)
+
 def parse_arguments():
     """Parse command line arguments"""
     parser = argparse.ArgumentParser(description="Analyze all stock Excel files in a directory")
@@ -37,12 +141,33 @@ def parse_arguments():
         "stocks_dir",
         help="Path to directory containing stock Excel files"
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Number of worker processes (defaults to the number of CPUs)"
+    )
+    parser.add_argument(
+        "--cache-dir",
+        default=str(DEFAULT_CACHE_DIR),
+        help="Directory for cached analysis results"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Re-analyze every workbook, ignoring cached results"
+    )
+    parser.add_argument(
+        "-q", "--quiet",
+        action="store_true",
+        help="Only print totals, without per-file progress or listings"
+    )
     return parser.parse_args()
 
 def main():
     """Main function to analyze all stock files"""
     args = parse_arguments()
-    logger = setup_logging()
+    logger = setup_logging(args.quiet)
     
     # Define paths from command line argument
     stocks_dir = Path(args.stocks_dir)
@@ -56,61 +181,120 @@ def main():
         logger.error(f"Path is not a directory: {stocks_dir}")
         sys.exit(1)
     
-    # List all Excel files
-    excel_files = list(stocks_dir.glob("*.xlsx"))
+    # Import the analyzer (pandas, openpyxl, numpy) only once the arguments are
+    # known to be usable; forked workers inherit the loaded modules
+    import multibagger.stock_analyzer  # noqa: F401
+    
+    # List all Excel files; DirEntry caches its type from readdir, so this
+    # avoids the per-entry Path construction and stat calls of Path.glob
+    with os.scandir(stocks_dir) as entries:
+        excel_files = [
+            entry.path for entry in entries
+            if entry.name.endswith(".xlsx") and entry.is_file()
+        ]
+    # list.sort computes each key once up front, so comparisons are plain
+    # C-level string compares; ordering is case-insensitive
+    excel_files.sort(key=str.lower)
     logger.info(f"Found {len(excel_files)} Excel files to analyze")
     
+    cache_dir = None
+    manifest = {}
+    if not args.no_cache:
+        cache_dir = args.cache_dir
+        Path(cache_dir).mkdir(parents=True, exist_ok=True)
+        manifest = load_manifest(cache_dir)
+    
     # Track results
     successful = []
     failed = []
     
-    for excel_file in sorted(excel_files):
-        logger.info(f"\n{'='*50}")
-        logger.info(f"Analyzing: {excel_file.name}")
-        logger.info(f"{'='*50}")
+    # Skip files whose (mtime, size) match a report from a previous run
+    # before any worker process is started
+    pending = []
+    file_stats = {}
+    for excel_path in excel_files:
+        file_name = os.path.basename(excel_path)
+        stat = os.stat(excel_path)
+        file_stats[excel_path] = [stat.st_mtime_ns, stat.st_size]
         
-        try:
-            # Run analysis - returns file path or None
-            result_path = analyze_stock_workbook(str(excel_file))
+        entry = manifest.get(os.path.abspath(excel_path))
+        if entry and entry[:2] == file_stats[excel_path] and os.path.exists(entry[2]):
+            successful.append(file_name)
+            logger.info(f"⏭️ Unchanged since last run: {file_name} ({entry[2]})")
+        else:
+            pending.append(excel_path)
+    
+    if pending:
+        # Forked workers inherit the parent's buffered records and would write
+        # them again on their own flush, so empty the buffer before forking
+        flush_log_handlers()
+        with ProcessPoolExecutor(max_workers=args.workers) as executor:
+            futures = {
+                executor.submit(analyze_file, excel_path, cache_dir): excel_path
+                for excel_path in pending
+            }
             
-            if result_path:
-                successful.append(excel_file.name)
-                logger.info(f"✅ Successfully analyzed: {excel_file.name}")
-                logger.info(f"📄 Report saved to: {result_path}")
-            else:
-                failed.append({
-                    'file': excel_file.name,
-                    'error': 'Analysis returned None - check logs for details'
-                })
-                logger.error(f"❌ Failed to analyze: {excel_file.name}")
+            # Report each workbook the moment its worker returns, so one slow
+            # file never holds back the results of the others
+            for completed, future in enumerate(as_completed(futures), 1):
+                excel_path = futures[future]
+                file_name = os.path.basename(excel_path)
+                logger.info(f"--- [{completed}/{len(futures)}] {file_name} ---")
                 
-        except Exception as e:
-            failed.append({
-                'file': excel_file.name,
-                'error': str(e)
-            })
-            logger.error(f"❌ Exception analyzing {excel_file.name}: {str(e)}")
-        
-        # Small delay between analyses
-        time.sleep(1)
+                try:
+                    # Run analysis - returns file path or None
+                    result_path = future.result()
+                    
+                    if result_path:
+                        successful.append(file_name)
+                        manifest[os.path.abspath(excel_path)] = file_stats[excel_path] + [result_path]
+                        logger.info(f"✅ Successfully analyzed: {file_name}")
+                        logger.info(f"📄 Report saved to: {result_path}")
+                    else:
+                        failed.append({
+                            'file': file_name,
+                            'error': 'Analysis returned None - check logs for details'
+                        })
+                        logger.error(f"❌ Failed to analyze: {file_name}")
+                        
+                except Exception as e:
+                    failed.append({
+                        'file': file_name,
+                        'error': str(e)
+                    })
+                    logger.error(f"❌ Exception analyzing {file_name}: {str(e)}")
+    
+    if cache_dir is not None:
+        save_manifest(cache_dir, manifest)
+    
+    # Results arrive in completion order; keep the summary alphabetical
+    successful.sort(key=str.lower)
+    failed.sort(key=lambda item: item['file'].lower())
+    
+    # Print summary, one log record per section
+    logger.info("\n".join([
+        f"\n{'='*60}",
+        "ANALYSIS SUMMARY",
+        f"{'='*60}",
+        f"Total files: {len(excel_files)}",
+        f"Successfully analyzed: {len(successful)}",
+        f"Failed: {len(failed)}",
+    ]))
     
-    # Print summary
-    logger.info(f"\n{'='*60}")
-    logger.info("ANALYSIS SUMMARY")
-    logger.info(f"{'='*60}")
-    logger.info(f"Total files: {len(excel_files)}")
-    logger.info(f"Successfully analyzed: {len(successful)}")
-    logger.info(f"Failed: {len(failed)}")
+    if args.quiet:
+        # Marked as summary so the quiet-mode stream filter lets it through
+        logger.info("Total files: %d, successful: %d, failed: %d",
+                    len(excel_files), len(successful), len(failed),
+                    extra={'summary': True})
+        return successful, failed
     
     if successful:
-        logger.info(f"\n✅ SUCCESSFUL ANALYSES ({len(successful)}):")
-        for file in successful:
-            logger.info(f"  - {file}")
+        body = "\n".join(f"  - {file}" for file in successful)
+        logger.info("\n✅ SUCCESSFUL ANALYSES (%d):\n%s", len(successful), body)
     
     if failed:
-        logger.info(f"\n❌ FAILED ANALYSES ({len(failed)}):")
-        for item in failed:
-            logger.info(f"  - {item['file']}: {item['error']}")
+        body = "\n".join(f"  - {item['file']}: {item['error']}" for item in failed)
+        logger.info("\n❌ FAILED ANALYSES (%d):\n%s", len(failed), body)
     
     return successful, failed
 
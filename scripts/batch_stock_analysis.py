@@ -10,50 +10,287 @@ import os
 import sys
 import json
 import logging
-from datetime import datetime
+import math
+import multiprocessing
+import time
+from bisect import bisect_left, bisect_right
+from collections import ChainMap
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed, wait
+from datetime import datetime, timedelta
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
 from typing import List, Dict, Any, Tuple, Optional
 
+import numpy as np
+
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from multibagger.stock_analyzer import analyze_stock_workbook, get_analysis_summary
-from multibagger.utils import setup_logging
+from multibagger.stock_analyzer import analyze_stock_workbook_with_data, get_analysis_summary
+from multibagger.utils import get_analyzer_fingerprint, load_json_report, setup_logging
+
+# Markdown reports are written on a small thread pool so disk latency overlaps analysis
+MARKDOWN_WRITER_THREADS = 4  # default writer count
+MARKDOWN_WRITE_TIMEOUT = 10  # seconds to wait on outstanding report writes once analysis ends
+
+# Translation table for report filenames, built once per process
+REPORT_FILENAME_TABLE = str.maketrans({' ': '_', '.': None, '-': '_'})
+
+# Metric fields read by the report, fetched in one call per section
+GROWTH_KEYS = (
+    'revenue_cagr_3yr', 'revenue_cagr_5yr', 'revenue_cagr_10yr',
+    'profit_cagr_3yr', 'profit_cagr_5yr', 'profit_cagr_10yr',
+    'eps_cagr_3yr', 'eps_cagr_5yr', 'eps_cagr_10yr',
+)
+PROFITABILITY_KEYS = ('operating_margin', 'net_profit_margin', 'roe', 'roce')
+LEVERAGE_KEYS = ('debt_to_equity', 'interest_coverage_ratio')
+CASH_FLOW_KEYS = ('ocf_to_net_income', 'fcf_to_revenue')
+VALUATION_KEYS = ('pe_ratio', 'pb_ratio', 'peg_ratio')
+CATEGORY_SCORE_KEYS = (
+    'growth_score', 'profitability_score', 'financial_health_score',
+    'cash_flow_score', 'valuation_score',
+)
+
+GROWTH_FIELDS = itemgetter(*GROWTH_KEYS)
+PROFITABILITY_FIELDS = itemgetter(*PROFITABILITY_KEYS)
+LEVERAGE_FIELDS = itemgetter(*LEVERAGE_KEYS)
+CASH_FLOW_FIELDS = itemgetter(*CASH_FLOW_KEYS)
+VALUATION_FIELDS = itemgetter(*VALUATION_KEYS)
+CATEGORY_SCORE_FIELDS = itemgetter(*CATEGORY_SCORE_KEYS)
+
+# Missing metrics default to 0
+ZERO_DEFAULTS = dict.fromkeys(
+    GROWTH_KEYS + PROFITABILITY_KEYS + LEVERAGE_KEYS + CASH_FLOW_KEYS
+    + VALUATION_KEYS + CATEGORY_SCORE_KEYS,
+    0,
+)
+
+
+# Narrative sentences per metric tier, indexed by bisecting ascending thresholds.
+# bisect_left keeps a value equal to a threshold in the lower tier (strict '>'
+# cut-offs); bisect_right moves it to the upper tier ('>=' and strict '<').
+# NaN bisects to the bottom with bisect_left but to the top with bisect_right,
+# so '>=' lookups must send NaN to the lowest tier explicitly.
+REVENUE_GROWTH_TIERS = (10, 15)
+REVENUE_GROWTH_NARRATIVE = (
+    "Revenue growth has been modest with a 5-year CAGR of {}. ",
+    "The company shows moderate revenue growth with a 5-year CAGR of {}. ",
+    "The company demonstrates strong revenue growth with a 5-year CAGR of {}. ",
+)
+DEBT_EQUITY_TIERS = (0.5, 1.0)
+DEBT_EQUITY_NARRATIVE = (
+    "The company maintains a conservative debt profile with low leverage. ",
+    "Debt levels are manageable and within acceptable limits. ",
+    "High debt levels may pose financial risks and limit flexibility. ",
+)
+CURRENT_RATIO_TIERS = (1.5, 2.0)
+CURRENT_RATIO_NARRATIVE = (
+    "Liquidity concerns as current ratio is below recommended levels.",
+    "Adequate liquidity but could be strengthened.",
+    "Strong liquidity position ensures ability to meet short-term obligations.",
+)
+OCF_NET_TIERS = (1.0, 1.2)
+OCF_NET_NARRATIVE = (
+    "Cash conversion needs attention as operating cash flow is below net profit levels. ",
+    "Good cash conversion quality indicating healthy business operations. ",
+    "Excellent cash conversion with operating cash flow exceeding net profit. ",
+)
+FCF_REVENUE_TIERS = (5, 10)
+FCF_REVENUE_NARRATIVE = (
+    "Limited free cash flow generation may constrain growth opportunities.",
+    "Moderate free cash flow generation supports business operations.",
+    "Strong free cash flow generation provides flexibility for growth investments and dividends.",
+)
+SCORE_TIERS = (50, 70)
+SCORE_RATIONALE = (
+    "With an investment score of {}/100, this stock shows weak fundamentals and significant risks. ",
+    "With an investment score of {}/100, this stock shows mixed fundamentals with both strengths and areas for improvement. ",
+    "With an investment score of {}/100, this stock shows strong fundamentals across multiple metrics. ",
+)
+SCORE_POSITION_SIZING = (
+    "- **Avoid**: Not recommended for investment at current levels\n"
+    "- **Watch list only**: Monitor for significant improvements\n",
+    "- **Partial Position**: Consider for 1-2% portfolio allocation\n"
+    "- **Wait for better entry**: Monitor for improvement in metrics\n",
+    "- **Full Position**: Consider for 3-5% portfolio allocation\n"
+    "- **Buy on dips**: Suitable for systematic investment\n",
+)
+PE_TIERS = (15, 25)
+PE_ENTRY_STRATEGY = (
+    "Current valuation appears attractive for entry.\n",
+    "Fair valuation - consider dollar-cost averaging.\n",
+    "Expensive valuation - wait for price correction.\n",
+)
+
+
+@lru_cache(maxsize=1024)
+def format_currency(value: float) -> str:
+    """Format currency values in Crores."""
+    if value == 0:
+        return "₹0.00 Cr"
+    return f"₹{value/100:.2f} Cr" if value >= 100 else f"₹{value:.2f} Cr"
+
+
+@lru_cache(maxsize=1024)
+def format_percentage(value: float) -> str:
+    """Format percentage values."""
+    return f"{value:.2f}%" if value != 0 else "0.00%"
+
+
+@lru_cache(maxsize=1024)
+def get_quality_rating(value: float, excellent: float = 20, good: float = 15, fair: float = 10) -> str:
+    """Get quality rating based on thresholds."""
+    if value >= excellent:
+        return "Excellent"
+    elif value >= good:
+        return "Good"
+    elif value >= fair:
+        return "Fair"
+    else:
+        return "Poor"
+
+
+@lru_cache(maxsize=1024)
+def get_trend_arrow(current: float, historical_avg: float) -> str:
+    """Get trend arrow comparing a value to its historical average."""
+    if current > historical_avg * 1.1:
+        return "↑"
+    elif current < historical_avg * 0.9:
+        return "↓"
+    else:
+        return "→"
+
+
+@lru_cache(maxsize=1024)
+def get_status(value: float, benchmark: float) -> str:
+    """Get status of a value against a benchmark."""
+    if value >= benchmark:
+        return "Good"
+    elif value >= benchmark * 0.7:
+        return "Fair"
+    else:
+        return "Poor"
+
+
+@lru_cache(maxsize=1024)
+def score_to_performance(score: float, max_score: float) -> str:
+    """Convert a category score into a performance label."""
+    percentage = (score / max_score) * 100 if max_score > 0 else 0
+    if percentage >= 80:
+        return "Excellent"
+    elif percentage >= 60:
+        return "Good"
+    elif percentage >= 40:
+        return "Fair"
+    else:
+        return "Poor"
+
+
+def restore_nan(value: Any) -> Any:
+    """
+    Turn the nulls orjson writes for NaN/inf back into NaN.
+    
+    Analysis reports hold no genuine nulls, so every None read back from a
+    cached report stands for a non-finite metric.
+    
+    Args:
+        value: Parsed JSON value
+        
+    Returns:
+        The value with every None replaced by NaN
+    """
+    if value is None:
+        return math.nan
+    if isinstance(value, dict):
+        return {key: restore_nan(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [restore_nan(item) for item in value]
+    return value
+
+
+def analyze_excel_file(excel_path: Path) -> Tuple[str, Optional[str], Optional[str], Optional[Dict[str, Any]]]:
+    """
+    Run analysis on a single Excel file in a worker process.
+    
+    Args:
+        excel_path: Path to Excel file
+        
+    Returns:
+        Tuple of (excel file name, JSON path or None, error message or None, analysis data or None)
+    """
+    logger = logging.getLogger(__name__)
+    try:
+        logger.info("Starting analysis for: %s", excel_path.name)
+        result = analyze_stock_workbook_with_data(str(excel_path), "INFO")
+        if result:
+            json_path, data = result
+            return excel_path.name, json_path, None, data
+        return excel_path.name, None, 'Analysis returned None', None
+    except Exception as e:
+        return excel_path.name, None, f"Critical error analyzing {excel_path.name}: {str(e)}", None
+
+
+def get_pool_context() -> Optional[multiprocessing.context.BaseContext]:
+    """Use fork on Linux so workers inherit the already-imported analyzer modules."""
+    if sys.platform.startswith("linux"):
+        return multiprocessing.get_context("fork")
+    return None
 
 
 class BatchStockAnalyzer:
     """Handles batch processing of multiple stock Excel files."""
     
-    def __init__(self, stocks_directory: str, reports_directory: str):
+    def __init__(self, stocks_directory: str, reports_directory: str,
+                 num_workers: Optional[int] = None, use_cache: bool = True,
+                 num_writers: int = MARKDOWN_WRITER_THREADS):
         """
         Initialize batch analyzer.
         
         Args:
             stocks_directory: Path to directory containing Excel files
             reports_directory: Path to directory for saving reports
+            num_workers: Number of worker processes (defaults to CPU count)
+            use_cache: Reuse JSON analyses of workbooks unchanged since the last run
+            num_writers: Number of threads rendering and writing markdown reports
         """
         self.stocks_directory = Path(stocks_directory)
         self.reports_directory = Path(reports_directory)
+        self.num_workers = num_workers or os.cpu_count() or 1
+        self.use_cache = use_cache
+        self.num_writers = max(1, num_writers)
         self.analysis_log = []
         self.successful_analyses = []
         self.failed_analyses = []
+        self.start_batch_clock()
         
         # Setup logging
         setup_logging("INFO")
         self.logger = logging.getLogger(__name__)
         
-        # Ensure reports directory exists
+        # Ensure reports directory exists, then pin its resolved path so later
+        # joins never re-resolve relative or symlinked components
         self.reports_directory.mkdir(parents=True, exist_ok=True)
+        self.reports_directory = self.reports_directory.resolve()
         
         # Create analysis log file
         self.log_file = self.reports_directory / "analysis_log.txt"
         
+        # Index of (mtime, size, JSON path) per workbook from earlier runs
+        self.cache_file = self.reports_directory / ".analysis_cache.json"
+        
     def get_excel_files(self) -> List[Path]:
         """Get all Excel files from the stocks directory."""
-        excel_files = []
-        for file_path in self.stocks_directory.glob("*.xlsx"):
-            if not file_path.name.startswith("~"):  # Skip temp files
-                excel_files.append(file_path)
+        # A missing directory has no files, as with the earlier glob()
+        if not self.stocks_directory.is_dir():
+            return []
+        
+        # Filter on DirEntry names so rejected entries never become Path objects
+        with os.scandir(self.stocks_directory) as entries:
+            excel_files = [Path(entry.path) for entry in entries
+                           if entry.name.endswith(".xlsx")
+                           and not entry.name.startswith("~")  # Skip temp files
+                           and entry.is_file()]
         
         return sorted(excel_files)
     
@@ -67,59 +304,72 @@ class BatchStockAnalyzer:
         Returns:
             Path to generated JSON file or None if failed
         """
-        try:
-            self.logger.info(f"Starting analysis for: {excel_path.name}")
-            
-            # Run the stock analysis
-            json_path = analyze_stock_workbook(str(excel_path), "INFO")
+        excel_name, json_path, error, _ = analyze_excel_file(excel_path)
+        return self.record_analysis_result(excel_name, json_path, error)
+    
+    def record_analysis_result(self, excel_name: str, json_path: Optional[str],
+                               error: Optional[str]) -> Optional[str]:
+        """
+        Record the outcome of a single file analysis.
+        
+        Args:
+            excel_name: Name of the analyzed Excel file
+            json_path: Path to generated JSON file or None if failed
+            error: Error message if the analysis failed
             
-            if json_path:
-                self.logger.info(f"Analysis successful for {excel_path.name}")
-                self.successful_analyses.append({
-                    'excel_file': excel_path.name,
-                    'json_file': json_path,
-                    'timestamp': datetime.now().isoformat()
-                })
-                return json_path
-            else:
-                self.logger.error(f"Analysis failed for {excel_path.name}")
-                self.failed_analyses.append({
-                    'excel_file': excel_path.name,
-                    'error': 'Analysis returned None',
-                    'timestamp': datetime.now().isoformat()
-                })
-                return None
-                
-        except Exception as e:
-            error_msg = f"Critical error analyzing {excel_path.name}: {str(e)}"
-            self.logger.error(error_msg)
-            self.failed_analyses.append({
-                'excel_file': excel_path.name,
-                'error': error_msg,
-                'timestamp': datetime.now().isoformat()
+        Returns:
+            Path to generated JSON file or None if failed
+        """
+        if json_path:
+            self.logger.info("Analysis successful for %s", excel_name)
+            self.successful_analyses.append({
+                'excel_file': excel_name,
+                'json_file': json_path,
+                'mono_offset_ns': time.monotonic_ns() - self._batch_start_mono
             })
-            return None
+            return json_path
+        
+        self.logger.error("Analysis failed for %s: %s", excel_name, error)
+        self.failed_analyses.append({
+            'excel_file': excel_name,
+            'error': error,
+            'mono_offset_ns': time.monotonic_ns() - self._batch_start_mono
+        })
+        return None
     
-    def create_markdown_report(self, json_path: str) -> Optional[str]:
+    def start_batch_clock(self):
+        """Anchor record timestamps to the wall clock once per analyzer."""
+        self._batch_start_wall = datetime.now()
+        self._batch_start_mono = time.monotonic_ns()
+    
+    def record_timestamp(self, record: Dict[str, Any]) -> str:
+        """Reconstruct the ISO timestamp of a success or failure record."""
+        return (self._batch_start_wall + timedelta(microseconds=record['mono_offset_ns'] / 1000)).isoformat()
+    
+    def create_markdown_report(self, json_path: str, data: Optional[Dict[str, Any]] = None) -> Optional[str]:
         """
         Create comprehensive markdown investment report from JSON data.
         
         Args:
             json_path: Path to JSON analysis file
+            data: Analysis data already in memory; loaded from json_path if omitted
             
         Returns:
             Path to markdown report or None if failed
         """
         try:
-            # Load JSON data
-            with open(json_path, 'r') as f:
-                data = json.load(f)
+            # Load JSON data unless the analyzer handed it over directly
+            if data is None:
+                data = load_json_report(json_path)
+                if data is None:
+                    return None
+                data = restore_nan(data)
             
             company_name = data.get('company_info', {}).get('name', 'Unknown_Company')
             timestamp = datetime.now().strftime('%H%M%S')
             
             # Clean company name for filename
-            clean_name = company_name.upper().replace(' ', '_').replace('.', '').replace('-', '_')
+            clean_name = company_name.upper().translate(REPORT_FILENAME_TABLE)
             markdown_filename = f"{clean_name}_Investment_Report_{timestamp}.md"
             markdown_path = self.reports_directory / markdown_filename
             
@@ -127,14 +377,13 @@ class BatchStockAnalyzer:
             markdown_content = self._generate_markdown_content(data)
             
             # Save markdown file
-            with open(markdown_path, 'w', encoding='utf-8') as f:
-                f.write(markdown_content)
+            markdown_path.write_text(markdown_content, encoding='utf-8')
             
-            self.logger.info(f"Markdown report created: {markdown_path}")
+            self.logger.info("Markdown report created: %s", markdown_path)
             return str(markdown_path)
             
         except Exception as e:
-            self.logger.error(f"Error creating markdown report for {json_path}: {str(e)}")
+            self.logger.error("Error creating markdown report for %s: %s", json_path, e)
             return None
     
     def _generate_markdown_content(self, data: Dict[str, Any]) -> str:
@@ -148,33 +397,8 @@ class BatchStockAnalyzer:
         thesis = data.get('investment_thesis', {})
         metadata = data.get('analysis_metadata', {})
         
-        # Helper function to safely get values
-        def safe_get(d, key, default=0):
-            return d.get(key, default) if d else default
-        
-        def format_currency(value):
-            """Format currency values in Crores."""
-            if value == 0:
-                return "₹0.00 Cr"
-            return f"₹{value/100:.2f} Cr" if value >= 100 else f"₹{value:.2f} Cr"
-        
-        def format_percentage(value):
-            """Format percentage values."""
-            return f"{value:.2f}%" if value != 0 else "0.00%"
-        
-        def get_quality_rating(value, thresholds):
-            """Get quality rating based on thresholds."""
-            if value >= thresholds.get('excellent', 20):
-                return "Excellent"
-            elif value >= thresholds.get('good', 15):
-                return "Good"
-            elif value >= thresholds.get('fair', 10):
-                return "Fair"
-            else:
-                return "Poor"
-        
         # Start building markdown content
-        markdown = f"""# {company_info.get('name', 'Unknown Company')} - Investment Analysis Report
+        parts = [f"""# {company_info.get('name', 'Unknown Company')} - Investment Analysis Report
 
 ## Executive Summary
 
@@ -196,169 +420,114 @@ class BatchStockAnalyzer:
 
 ### 📈 Growth Metrics
 
-"""
+"""]
         
         # Growth metrics table
         growth = metrics.get('growth_metrics', {})
-        markdown += """| Metric       | 3-Year | 5-Year | 10-Year | Assessment |
+        parts.append("""| Metric       | 3-Year | 5-Year | 10-Year | Assessment |
 |--------------|--------|--------|---------|------------|
-"""
+""")
         
-        revenue_3yr = safe_get(growth, 'revenue_cagr_3yr')
-        revenue_5yr = safe_get(growth, 'revenue_cagr_5yr')
-        revenue_10yr = safe_get(growth, 'revenue_cagr_10yr')
-        profit_3yr = safe_get(growth, 'profit_cagr_3yr')
-        profit_5yr = safe_get(growth, 'profit_cagr_5yr')
-        profit_10yr = safe_get(growth, 'profit_cagr_10yr')
-        eps_3yr = safe_get(growth, 'eps_cagr_3yr')
-        eps_5yr = safe_get(growth, 'eps_cagr_5yr')
-        eps_10yr = safe_get(growth, 'eps_cagr_10yr')
+        (revenue_3yr, revenue_5yr, revenue_10yr,
+         profit_3yr, profit_5yr, profit_10yr,
+         eps_3yr, eps_5yr, eps_10yr) = GROWTH_FIELDS(ChainMap(growth or {}, ZERO_DEFAULTS))
         
-        markdown += f"""| Revenue CAGR | {format_percentage(revenue_3yr)} | {format_percentage(revenue_5yr)} | {format_percentage(revenue_10yr)} | {get_quality_rating(revenue_5yr, {'excellent': 15, 'good': 10, 'fair': 5})} |
-| Profit CAGR  | {format_percentage(profit_3yr)} | {format_percentage(profit_5yr)} | {format_percentage(profit_10yr)} | {get_quality_rating(profit_5yr, {'excellent': 20, 'good': 15, 'fair': 10})} |
-| EPS Growth   | {format_percentage(eps_3yr)} | {format_percentage(eps_5yr)} | {format_percentage(eps_10yr)} | {get_quality_rating(eps_5yr, {'excellent': 15, 'good': 10, 'fair': 5})} |
+        parts.append(f"""| Revenue CAGR | {format_percentage(revenue_3yr)} | {format_percentage(revenue_5yr)} | {format_percentage(revenue_10yr)} | {get_quality_rating(revenue_5yr, 15, 10, 5)} |
+| Profit CAGR  | {format_percentage(profit_3yr)} | {format_percentage(profit_5yr)} | {format_percentage(profit_10yr)} | {get_quality_rating(profit_5yr, 20, 15, 10)} |
+| EPS Growth   | {format_percentage(eps_3yr)} | {format_percentage(eps_5yr)} | {format_percentage(eps_10yr)} | {get_quality_rating(eps_5yr, 15, 10, 5)} |
 
-**Growth Analysis**: """
+**Growth Analysis**: """)
         
         # Add growth analysis
-        if revenue_5yr > 15:
-            markdown += f"The company demonstrates strong revenue growth with a 5-year CAGR of {format_percentage(revenue_5yr)}. "
-        elif revenue_5yr > 10:
-            markdown += f"The company shows moderate revenue growth with a 5-year CAGR of {format_percentage(revenue_5yr)}. "
-        else:
-            markdown += f"Revenue growth has been modest with a 5-year CAGR of {format_percentage(revenue_5yr)}. "
+        parts.append(REVENUE_GROWTH_NARRATIVE[bisect_left(REVENUE_GROWTH_TIERS, revenue_5yr)].format(format_percentage(revenue_5yr)))
         
         if profit_5yr > revenue_5yr and profit_5yr > 20:
-            markdown += "Profit growth is outpacing revenue growth, indicating improving operational efficiency and margin expansion."
+            parts.append("Profit growth is outpacing revenue growth, indicating improving operational efficiency and margin expansion.")
         elif profit_5yr > 15:
-            markdown += "Profit growth is healthy, suggesting good operational management."
+            parts.append("Profit growth is healthy, suggesting good operational management.")
         else:
-            markdown += "Profit growth needs attention as it may indicate margin pressure or operational challenges."
+            parts.append("Profit growth needs attention as it may indicate margin pressure or operational challenges.")
         
         # Profitability section
         profitability = metrics.get('profitability_ratios', {})
-        markdown += f"""
+        parts.append(f"""
 
 ### 💰 Profitability Ratios
 
 | Metric            | Current | Trend   | Benchmark | Status           |
 |-------------------|---------|---------|-----------|------------------|
-"""
+""")
         
-        op_margin = safe_get(profitability, 'operating_margin')
-        net_margin = safe_get(profitability, 'net_profit_margin')
-        roe = safe_get(profitability, 'roe')
-        roce = safe_get(profitability, 'roce')
-        
-        def get_trend_arrow(current, historical_avg):
-            if current > historical_avg * 1.1:
-                return "↑"
-            elif current < historical_avg * 0.9:
-                return "↓"
-            else:
-                return "→"
+        op_margin, net_margin, roe, roce = PROFITABILITY_FIELDS(ChainMap(profitability or {}, ZERO_DEFAULTS))
         
-        def get_status(value, benchmark):
-            if value >= benchmark:
-                return "Good"
-            elif value >= benchmark * 0.7:
-                return "Fair"
-            else:
-                return "Poor"
-        
-        markdown += f"""| Operating Margin  | {format_percentage(op_margin)} | → | >15% | {get_status(op_margin, 15)} |
+        parts.append(f"""| Operating Margin  | {format_percentage(op_margin)} | → | >15% | {get_status(op_margin, 15)} |
 | Net Profit Margin | {format_percentage(net_margin)} | → | >10% | {get_status(net_margin, 10)} |
 | ROE               | {format_percentage(roe)} | → | >15% | {get_status(roe, 15)} |
 | ROCE              | {format_percentage(roce)} | → | >15% | {get_status(roce, 15)} |
 
-**Profitability Analysis**: """
+**Profitability Analysis**: """)
         
         if op_margin > 15 and net_margin > 10:
-            markdown += "The company demonstrates strong profitability with healthy operating and net margins. "
+            parts.append("The company demonstrates strong profitability with healthy operating and net margins. ")
         elif op_margin > 10 or net_margin > 5:
-            markdown += "Profitability metrics are moderate and within acceptable ranges. "
+            parts.append("Profitability metrics are moderate and within acceptable ranges. ")
         else:
-            markdown += "Profitability metrics are below industry benchmarks and need improvement. "
+            parts.append("Profitability metrics are below industry benchmarks and need improvement. ")
         
         if roe > 15 and roce > 15:
-            markdown += "Returns to shareholders and capital employed are excellent, indicating efficient capital allocation."
+            parts.append("Returns to shareholders and capital employed are excellent, indicating efficient capital allocation.")
         else:
-            markdown += "Returns could be improved through better capital allocation and operational efficiency."
+            parts.append("Returns could be improved through better capital allocation and operational efficiency.")
         
         # Balance sheet strength
         leverage = metrics.get('leverage_ratios', {})
         liquidity = metrics.get('liquidity_ratios', {})
         
-        debt_equity = safe_get(leverage, 'debt_to_equity')
-        current_ratio = safe_get(liquidity, 'current_ratio')
-        interest_coverage = safe_get(leverage, 'interest_coverage_ratio')
+        debt_equity, interest_coverage = LEVERAGE_FIELDS(ChainMap(leverage or {}, ZERO_DEFAULTS))
+        current_ratio = liquidity.get('current_ratio', 0) if liquidity else 0
         
-        markdown += f"""
+        parts.append(f"""
 
 ### 🏦 Balance Sheet Strength
 
 | Metric            | Current | Benchmark | Assessment                 |
 |-------------------|---------|-----------|----------------------------|
-| Debt/Equity       | {debt_equity:.2f} | <1.0      | {get_quality_rating(1/max(debt_equity, 0.1) * 10, {'excellent': 10, 'good': 5, 'fair': 2})} |
-| Current Ratio     | {current_ratio:.2f} | >2.0      | {get_quality_rating(current_ratio * 10, {'excellent': 25, 'good': 20, 'fair': 15})} |
-| Interest Coverage | {interest_coverage:.2f} | >5.0      | {get_quality_rating(min(interest_coverage, 20), {'excellent': 10, 'good': 5, 'fair': 2})} |
+| Debt/Equity       | {debt_equity:.2f} | <1.0      | {get_quality_rating(1/max(debt_equity, 0.1) * 10, 10, 5, 2)} |
+| Current Ratio     | {current_ratio:.2f} | >2.0      | {get_quality_rating(current_ratio * 10, 25, 20, 15)} |
+| Interest Coverage | {interest_coverage:.2f} | >5.0      | {get_quality_rating(min(interest_coverage, 20), 10, 5, 2)} |
 
-**Financial Health**: """
+**Financial Health**: """)
         
-        if debt_equity < 0.5:
-            markdown += "The company maintains a conservative debt profile with low leverage. "
-        elif debt_equity < 1.0:
-            markdown += "Debt levels are manageable and within acceptable limits. "
-        else:
-            markdown += "High debt levels may pose financial risks and limit flexibility. "
-        
-        if current_ratio > 2.0:
-            markdown += "Strong liquidity position ensures ability to meet short-term obligations."
-        elif current_ratio > 1.5:
-            markdown += "Adequate liquidity but could be strengthened."
-        else:
-            markdown += "Liquidity concerns as current ratio is below recommended levels."
+        parts.append(DEBT_EQUITY_NARRATIVE[bisect_right(DEBT_EQUITY_TIERS, debt_equity)])
+        parts.append(CURRENT_RATIO_NARRATIVE[bisect_left(CURRENT_RATIO_TIERS, current_ratio)])
         
         # Cash flow analysis
         cash_flow = metrics.get('cash_flow_ratios', {})
         
-        ocf_net_ratio = safe_get(cash_flow, 'ocf_to_net_income')
-        fcf_revenue = safe_get(cash_flow, 'fcf_to_revenue') * 100  # Convert to percentage
+        ocf_net_ratio, fcf_revenue = CASH_FLOW_FIELDS(ChainMap(cash_flow or {}, ZERO_DEFAULTS))
+        fcf_revenue = fcf_revenue * 100  # Convert to percentage
         
-        markdown += f"""
+        parts.append(f"""
 
 ### 💸 Cash Flow Analysis
 
 | Metric          | Value    | Quality                    |
 |-----------------|----------|----------------------------|
-| OCF/Net Profit  | {ocf_net_ratio:.2f} | {get_quality_rating(ocf_net_ratio * 10, {'excellent': 12, 'good': 10, 'fair': 8})} |
-| FCF/Revenue     | {format_percentage(fcf_revenue)} | {get_quality_rating(fcf_revenue, {'excellent': 10, 'good': 5, 'fair': 2})} |
+| OCF/Net Profit  | {ocf_net_ratio:.2f} | {get_quality_rating(ocf_net_ratio * 10, 12, 10, 8)} |
+| FCF/Revenue     | {format_percentage(fcf_revenue)} | {get_quality_rating(fcf_revenue, 10, 5, 2)} |
 | Cash Conversion | Data not available | Unable to calculate |
 
-**Cash Flow Quality**: """
+**Cash Flow Quality**: """)
         
-        if ocf_net_ratio > 1.2:
-            markdown += "Excellent cash conversion with operating cash flow exceeding net profit. "
-        elif ocf_net_ratio > 1.0:
-            markdown += "Good cash conversion quality indicating healthy business operations. "
-        else:
-            markdown += "Cash conversion needs attention as operating cash flow is below net profit levels. "
-        
-        if fcf_revenue > 10:
-            markdown += "Strong free cash flow generation provides flexibility for growth investments and dividends."
-        elif fcf_revenue > 5:
-            markdown += "Moderate free cash flow generation supports business operations."
-        else:
-            markdown += "Limited free cash flow generation may constrain growth opportunities."
+        parts.append(OCF_NET_NARRATIVE[bisect_left(OCF_NET_TIERS, ocf_net_ratio)])
+        parts.append(FCF_REVENUE_NARRATIVE[bisect_left(FCF_REVENUE_TIERS, fcf_revenue)])
         
         # Valuation metrics
         valuation = metrics.get('valuation_ratios', {})
         
-        pe_ratio = safe_get(valuation, 'pe_ratio')
-        pb_ratio = safe_get(valuation, 'pb_ratio')
-        peg_ratio = safe_get(valuation, 'peg_ratio')
+        pe_ratio, pb_ratio, peg_ratio = VALUATION_FIELDS(ChainMap(valuation or {}, ZERO_DEFAULTS))
         
-        markdown += f"""
+        parts.append(f"""
 
 ### 📊 Valuation Metrics
 
@@ -370,164 +539,147 @@ class BatchStockAnalyzer:
 
 ## Investment Scoring Breakdown
 
-"""
+""")
         
         # Investment scoring table
         category_scores = investment_score.get('category_scores', {})
+        (growth_score, profitability_score, financial_health_score,
+         cash_flow_score, valuation_score) = CATEGORY_SCORE_FIELDS(ChainMap(category_scores or {}, ZERO_DEFAULTS))
         
-        def score_to_performance(score, max_score):
-            percentage = (score / max_score) * 100 if max_score > 0 else 0
-            if percentage >= 80:
-                return "Excellent"
-            elif percentage >= 60:
-                return "Good"
-            elif percentage >= 40:
-                return "Fair"
-            else:
-                return "Poor"
-        
-        markdown += f"""| Category          | Score | Max | Performance                |
+        parts.append(f"""| Category          | Score | Max | Performance                |
 |-------------------|-------|-----|----------------------------|
-| Growth Quality    | {safe_get(category_scores, 'growth_score'):.0f} | 20  | {score_to_performance(safe_get(category_scores, 'growth_score'), 20)} |
-| Profitability     | {safe_get(category_scores, 'profitability_score'):.0f} | 20  | {score_to_performance(safe_get(category_scores, 'profitability_score'), 20)} |
-| Financial Health  | {safe_get(category_scores, 'financial_health_score'):.0f} | 20  | {score_to_performance(safe_get(category_scores, 'financial_health_score'), 20)} |
-| Cash Flow Quality | {safe_get(category_scores, 'cash_flow_score'):.0f} | 20  | {score_to_performance(safe_get(category_scores, 'cash_flow_score'), 20)} |
-| Valuation         | {safe_get(category_scores, 'valuation_score'):.0f} | 20  | {score_to_performance(safe_get(category_scores, 'valuation_score'), 20)} |
+| Growth Quality    | {growth_score:.0f} | 20  | {score_to_performance(growth_score, 20)} |
+| Profitability     | {profitability_score:.0f} | 20  | {score_to_performance(profitability_score, 20)} |
+| Financial Health  | {financial_health_score:.0f} | 20  | {score_to_performance(financial_health_score, 20)} |
+| Cash Flow Quality | {cash_flow_score:.0f} | 20  | {score_to_performance(cash_flow_score, 20)} |
+| Valuation         | {valuation_score:.0f} | 20  | {score_to_performance(valuation_score, 20)} |
 | **Total Score**   | **{investment_score.get('total_score', 0):.0f}** | **100** | **{score_to_performance(investment_score.get('total_score', 0), 100)}** |
 
 ## Investment Thesis
 
 ### 🟢 Bull Case (Reasons to Invest)
 
-"""
+""")
         
         # Add bull points
         bull_points = thesis.get('bull_points', []) if thesis else []
         if bull_points:
             for point in bull_points:
-                markdown += f"- {point}\n"
+                parts.append(f"- {point}\n")
         else:
             # Generate bull points based on metrics
             if revenue_5yr > 15:
-                markdown += f"- Strong revenue growth with 5-year CAGR of {format_percentage(revenue_5yr)}\n"
+                parts.append(f"- Strong revenue growth with 5-year CAGR of {format_percentage(revenue_5yr)}\n")
             if roe > 15:
-                markdown += f"- Excellent return on equity of {format_percentage(roe)} indicates efficient management\n"
+                parts.append(f"- Excellent return on equity of {format_percentage(roe)} indicates efficient management\n")
             if debt_equity < 0.5:
-                markdown += f"- Conservative debt profile with D/E ratio of {debt_equity:.2f}\n"
+                parts.append(f"- Conservative debt profile with D/E ratio of {debt_equity:.2f}\n")
             if op_margin > 15:
-                markdown += f"- Strong operating margins of {format_percentage(op_margin)} show operational efficiency\n"
+                parts.append(f"- Strong operating margins of {format_percentage(op_margin)} show operational efficiency\n")
         
-        markdown += """
+        parts.append("""
 ### 🔴 Bear Case (Key Concerns)
 
-"""
+""")
         
         # Add bear points
         bear_points = thesis.get('bear_points', []) if thesis else []
         if bear_points:
             for point in bear_points:
-                markdown += f"- {point}\n"
+                parts.append(f"- {point}\n")
         else:
             # Generate bear points based on metrics
             if revenue_5yr < 5:
-                markdown += f"- Slow revenue growth with 5-year CAGR of only {format_percentage(revenue_5yr)}\n"
+                parts.append(f"- Slow revenue growth with 5-year CAGR of only {format_percentage(revenue_5yr)}\n")
             if net_margin < 5:
-                markdown += f"- Low net profit margins of {format_percentage(net_margin)} indicate profitability challenges\n"
+                parts.append(f"- Low net profit margins of {format_percentage(net_margin)} indicate profitability challenges\n")
             if debt_equity > 1.0:
-                markdown += f"- High debt levels with D/E ratio of {debt_equity:.2f} may limit flexibility\n"
+                parts.append(f"- High debt levels with D/E ratio of {debt_equity:.2f} may limit flexibility\n")
             if pe_ratio > 30:
-                markdown += f"- High P/E ratio of {pe_ratio:.2f} suggests expensive valuation\n"
+                parts.append(f"- High P/E ratio of {pe_ratio:.2f} suggests expensive valuation\n")
         
-        markdown += """
+        parts.append("""
 ### ⚖️ Key Risks
 
-"""
+""")
         
         # Add risk factors
         risk_factors = thesis.get('risk_factors', []) if thesis else []
         if risk_factors:
             for risk in risk_factors:
-                markdown += f"- {risk}\n"
+                parts.append(f"- {risk}\n")
         else:
             # Generate generic risk factors
-            markdown += "- Market volatility and economic downturns\n"
-            markdown += "- Industry-specific regulatory changes\n"
-            markdown += "- Competition from established and new players\n"
-            markdown += "- Execution risks in growth initiatives\n"
+            parts.append("- Market volatility and economic downturns\n")
+            parts.append("- Industry-specific regulatory changes\n")
+            parts.append("- Competition from established and new players\n")
+            parts.append("- Execution risks in growth initiatives\n")
         
         # Historical performance
         years = historical.get('years', [])
         revenues = historical.get('revenue', [])
         
-        markdown += """
+        parts.append("""
 ## Historical Performance
 
 ### Revenue Trend (Last 10 Years)
 
-"""
+""")
         
         if years and revenues and len(years) > 1:
-            markdown += "| Year | Revenue (₹ Cr) | YoY Growth |\n"
-            markdown += "|------|----------------|------------|\n"
+            parts.append("| Year | Revenue (₹ Cr) | YoY Growth |\n")
+            parts.append("|------|----------------|------------|\n")
+            
+            # Align revenues with years (missing years count as 0) and compute
+            # YoY growth in one pass; NaN marks years without a positive base
+            revenue = np.zeros(len(years))
+            known = min(len(years), len(revenues))
+            revenue[:known] = revenues[:known]
+            previous = revenue[:-1]
+            has_base = previous > 0
+            yoy_growth = np.full(len(years), np.nan)
+            yoy_growth[1:][has_base] = ((revenue[1:][has_base] - previous[has_base]) / previous[has_base]) * 100
             
-            for i, year in enumerate(years):
-                revenue = revenues[i] if i < len(revenues) else 0
-                if i > 0 and revenues[i-1] > 0:
-                    growth = ((revenue - revenues[i-1]) / revenues[i-1]) * 100
-                    markdown += f"| {year} | {revenue/100:.2f} | {growth:.1f}% |\n"
+            for year, amount, growth in zip(years, revenue / 100, yoy_growth):
+                if np.isnan(growth):
+                    parts.append(f"| {year} | {amount:.2f} | - |\n")
                 else:
-                    markdown += f"| {year} | {revenue/100:.2f} | - |\n"
+                    parts.append(f"| {year} | {amount:.2f} | {growth:.1f}% |\n")
         else:
-            markdown += "Historical revenue data not available.\n"
+            parts.append("Historical revenue data not available.\n")
         
         # Final recommendation
         total_score = investment_score.get('total_score', 0)
         recommendation = investment_score.get('recommendation', 'UNKNOWN')
         
-        markdown += f"""
+        parts.append(f"""
 ## Final Investment Recommendation
 
 ### 🎯 Recommendation: {recommendation}
 
-**Rationale**: """
+**Rationale**: """)
         
-        if total_score >= 70:
-            markdown += f"With an investment score of {total_score}/100, this stock shows strong fundamentals across multiple metrics. "
-        elif total_score >= 50:
-            markdown += f"With an investment score of {total_score}/100, this stock shows mixed fundamentals with both strengths and areas for improvement. "
-        else:
-            markdown += f"With an investment score of {total_score}/100, this stock shows weak fundamentals and significant risks. "
+        # NaN fails every '>=' check, so it gets the weakest tier
+        score_tier = 0 if math.isnan(total_score) else bisect_right(SCORE_TIERS, total_score)
+        parts.append(SCORE_RATIONALE[score_tier].format(total_score))
         
         # Position sizing recommendations
-        markdown += f"""
+        parts.append(f"""
 
 **Position Sizing**:
-"""
+""")
         
-        if total_score >= 70:
-            markdown += "- **Full Position**: Consider for 3-5% portfolio allocation\n"
-            markdown += "- **Buy on dips**: Suitable for systematic investment\n"
-        elif total_score >= 50:
-            markdown += "- **Partial Position**: Consider for 1-2% portfolio allocation\n"
-            markdown += "- **Wait for better entry**: Monitor for improvement in metrics\n"
-        else:
-            markdown += "- **Avoid**: Not recommended for investment at current levels\n"
-            markdown += "- **Watch list only**: Monitor for significant improvements\n"
+        parts.append(SCORE_POSITION_SIZING[score_tier])
         
-        markdown += f"""
-**Entry Strategy**: """
+        parts.append(f"""
+**Entry Strategy**: """)
         
         if pe_ratio > 0:
-            if pe_ratio < 15:
-                markdown += "Current valuation appears attractive for entry.\n"
-            elif pe_ratio < 25:
-                markdown += "Fair valuation - consider dollar-cost averaging.\n"
-            else:
-                markdown += "Expensive valuation - wait for price correction.\n"
+            parts.append(PE_ENTRY_STRATEGY[bisect_right(PE_TIERS, pe_ratio)])
         else:
-            markdown += "Valuation assessment limited due to lack of earnings data.\n"
+            parts.append("Valuation assessment limited due to lack of earnings data.\n")
         
-        markdown += f"""
+        parts.append(f"""
 **Key Monitoring Points**:
 - Revenue growth trajectory and market share trends
 - Margin expansion or contraction patterns  
@@ -544,16 +696,16 @@ class BatchStockAnalyzer:
 
 **Data Quality Assessment**: {metadata.get('data_quality', 'Unknown')}
 
-**Missing Data Points**: """
+**Missing Data Points**: """)
         
         missing_data = metadata.get('missing_data_points', [])
         if missing_data:
             for missing in missing_data:
-                markdown += f"- {missing}\n"
+                parts.append(f"- {missing}\n")
         else:
-            markdown += "- None identified\n"
+            parts.append("- None identified\n")
         
-        markdown += f"""
+        parts.append(f"""
 **Analysis Limitations**: 
 - Analysis based on historical financial data only
 - Market sentiment and qualitative factors not included
@@ -564,9 +716,9 @@ class BatchStockAnalyzer:
 
 *Report generated on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')} using automated financial analysis system.*
 *This report is for informational purposes only and should not be considered as investment advice.*
-"""
+""")
         
-        return markdown
+        return "".join(parts)
     
     def run_batch_analysis(self) -> Dict[str, Any]:
         """
@@ -581,7 +733,7 @@ class BatchStockAnalyzer:
         excel_files = self.get_excel_files()
         total_files = len(excel_files)
         
-        self.logger.info(f"Found {total_files} Excel files to analyze")
+        self.logger.info("Found %s Excel files to analyze", total_files)
         
         if total_files == 0:
             self.logger.warning("No Excel files found in the directory")
@@ -593,23 +745,74 @@ class BatchStockAnalyzer:
                 'reports_generated': []
             }
         
-        # Process each file
-        markdown_reports = []
-        
-        for i, excel_file in enumerate(excel_files, 1):
-            self.logger.info(f"Processing file {i}/{total_files}: {excel_file.name}")
+        # Reuse analyses of workbooks unchanged since the last run
+        cache = self.load_analysis_cache() if self.use_cache else {}
+        file_stats = {}
+        cached_files = []
+        pending_files = []
+        for excel_file in excel_files:
+            stat = excel_file.stat()
+            key = str(excel_file.resolve())
+            file_stats[key] = [stat.st_mtime_ns, stat.st_size]
+            entry = cache.get(key)
+            if entry and entry[:2] == file_stats[key] and os.path.exists(entry[2]):
+                self.logger.info("Unchanged since last run, reusing analysis for %s", excel_file.name)
+                cached_files.append((excel_file.name, entry[2]))
+            else:
+                pending_files.append(excel_file)
+        
+        # Start the worker pool before any writer thread exists, so forked
+        # workers never inherit a lock held by another thread
+        executor = None
+        futures = {}
+        if pending_files:
+            workers = min(self.num_workers, len(pending_files))
+            self.logger.info("Analyzing %s file(s) with %s worker process(es)", len(pending_files), workers)
+            executor = ProcessPoolExecutor(max_workers=workers, mp_context=get_pool_context())
+            futures = {executor.submit(analyze_excel_file, excel_file): excel_file
+                       for excel_file in pending_files}
+        
+        # Markdown reports are written in threads as results arrive
+        completed = 0
+        writer = ThreadPoolExecutor(max_workers=self.num_writers)
+        try:
+            report_futures = []
             
-            # Run stock analysis
-            json_path = self.run_analysis_on_file(excel_file)
+            for excel_name, json_path in cached_files:
+                self.record_analysis_result(excel_name, json_path, None)
+                report_futures.append((json_path, writer.submit(self.create_markdown_report, json_path)))
+                completed += 1
+                self.log_analysis_progress(completed, total_files)
             
-            if json_path:
-                # Create markdown report
-                markdown_path = self.create_markdown_report(json_path)
-                if markdown_path:
-                    markdown_reports.append(markdown_path)
+            for future in as_completed(futures):
+                try:
+                    excel_name, json_path, error, data = future.result()
+                except Exception as e:
+                    # A crashed worker breaks the pool; record the file as
+                    # failed so the summary, log and cache are still written
+                    excel_name, json_path, error, data = futures[future].name, None, str(e), None
+                json_path = self.record_analysis_result(excel_name, json_path, error)
+                
+                if json_path:
+                    key = str(futures[future].resolve())
+                    cache[key] = file_stats[key] + [json_path]
+                    
+                    # Create markdown report
+                    report_futures.append((json_path, writer.submit(self.create_markdown_report, json_path, data)))
+                
+                # Log progress
+                completed += 1
+                self.log_analysis_progress(completed, total_files)
             
-            # Log progress
-            self.log_analysis_progress(i, total_files)
+            markdown_reports = self.collect_markdown_reports(report_futures)
+        finally:
+            # Don't block on writes still stuck on a hung mount
+            writer.shutdown(wait=False)
+            if executor:
+                executor.shutdown()
+        
+        if self.use_cache:
+            self.save_analysis_cache(cache)
         
         # Create summary statistics
         successful_count = len(self.successful_analyses)
@@ -630,18 +833,67 @@ class BatchStockAnalyzer:
             'markdown_reports': markdown_reports
         }
         
-        self.logger.info(f"Batch analysis completed. Success rate: {success_rate:.1f}%")
+        self.logger.info("Batch analysis completed. Success rate: %.1f%%", success_rate)
         return results
     
+    def load_analysis_cache(self) -> Dict[str, List]:
+        """Load the per-workbook (mtime, size, JSON path) index from the last run."""
+        try:
+            cache = json.loads(self.cache_file.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return {}
+        
+        if cache.get('analyzer_fingerprint') != get_analyzer_fingerprint():
+            return {}
+        return cache.get('files', {})
+    
+    def save_analysis_cache(self, files: Dict[str, List]):
+        """Atomically write the per-workbook cache index."""
+        try:
+            tmp_path = self.cache_file.with_name(f"{self.cache_file.name}.{os.getpid()}.tmp")
+            tmp_path.write_text(
+                json.dumps({'analyzer_fingerprint': get_analyzer_fingerprint(), 'files': files}),
+                encoding='utf-8'
+            )
+            os.replace(tmp_path, self.cache_file)
+        except OSError as e:
+            self.logger.error("Error saving analysis cache: %s", e)
+    
+    def collect_markdown_reports(self, report_futures: List[Tuple[str, Any]]) -> List[str]:
+        """
+        Wait for pending markdown report writes, up to MARKDOWN_WRITE_TIMEOUT.
+        
+        Writes that have not started by the deadline are cancelled; writes
+        still running are left to finish in the background.
+        
+        Args:
+            report_futures: List of (JSON path, future) pairs for submitted reports
+        
+        Returns:
+            List of markdown report paths that were written before the deadline
+        """
+        _, not_done = wait([future for _, future in report_futures], timeout=MARKDOWN_WRITE_TIMEOUT)
+        markdown_reports = []
+        for json_path, future in report_futures:
+            if future in not_done:
+                future.cancel()
+                self.logger.warning("Markdown report for %s not written within %ss",
+                                    json_path, MARKDOWN_WRITE_TIMEOUT)
+                continue
+            markdown_path = future.result()
+            if markdown_path:
+                markdown_reports.append(markdown_path)
+        return markdown_reports
+    
     def log_analysis_progress(self, current: int, total: int):
         """Log analysis progress."""
         progress = (current / total) * 100
-        self.logger.info(f"Progress: {current}/{total} files processed ({progress:.1f}%)")
+        self.logger.info("Progress: %s/%s files processed (%.1f%%)", current, total, progress)
     
     def save_analysis_log(self):
         """Save detailed analysis log to file."""
         try:
-            log_content = f"""Stock Analysis Batch Log
+            lines = [f"""Stock Analysis Batch Log
 Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
 
 SUMMARY:
@@ -651,23 +903,19 @@ SUMMARY:
 - Success rate: {(len(self.successful_analyses) / (len(self.successful_analyses) + len(self.failed_analyses)) * 100):.1f}%
 
 SUCCESSFUL ANALYSES:
-"""
-            
-            for success in self.successful_analyses:
-                log_content += f"✓ {success['excel_file']} -> {success['json_file']} ({success['timestamp']})\n"
-            
-            log_content += "\nFAILED ANALYSES:\n"
-            
-            for failure in self.failed_analyses:
-                log_content += f"✗ {failure['excel_file']} - {failure['error']} ({failure['timestamp']})\n"
+"""]
+            lines.extend(f"✓ {success['excel_file']} -> {success['json_file']} ({self.record_timestamp(success)})\n"
+                         for success in self.successful_analyses)
+            lines.append("\nFAILED ANALYSES:\n")
+            lines.extend(f"✗ {failure['excel_file']} - {failure['error']} ({self.record_timestamp(failure)})\n"
+                         for failure in self.failed_analyses)
             
-            with open(self.log_file, 'w') as f:
-                f.write(log_content)
+            self.log_file.write_text("".join(lines), encoding='utf-8')
             
-            self.logger.info(f"Analysis log saved to: {self.log_file}")
+            self.logger.info("Analysis log saved to: %s", self.log_file)
             
         except Exception as e:
-            self.logger.error(f"Error saving analysis log: {str(e)}")
+            self.logger.error("Error saving analysis log: %s", e)
 
 
 def main():
@@ -5,10 +5,19 @@ A comprehensive tool for analyzing Excel workbooks containing financial data
 and generating structured investment analysis reports.
 """
 
-from .stock_analyzer import analyze_stock_workbook
-
 __version__ = "0.1.0"
 __author__ = "Multibagger Team"
 __email__ = "team@multibagger.com"
 
-__all__ = ["analyze_stock_workbook"]
\ No newline at end of file
+__all__ = ["analyze_stock_workbook", "analyze_stock_workbook_with_data"]
+
+
+def __getattr__(name):
+    """Import the analysis entry points on first access so that importing the
+    package (e.g. for __version__ or config) does not load pandas."""
+    if name in __all__:
+        from . import stock_analyzer
+        value = getattr(stock_analyzer, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -5,8 +5,19 @@ This module contains configuration settings, scoring thresholds, and constants
 used throughout the stock analysis system.
 """
 
+import math
+import sys
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Dict, Any
 
+import numpy as np
+
+# Shared upper bound for open-ended tiers; math.inf is a single object, so keep
+# referencing _INF rather than writing new float('inf') literals
+_INF = math.inf
+
 # Investment Scoring Configuration (100 points total)
 SCORING_FRAMEWORK = {
     'growth_quality': {
@@ -33,7 +44,7 @@ SCORING_FRAMEWORK = {
             'excellent': {'max_de': 0.5, 'min_liquidity': 2.0, 'points': 20},
             'good': {'max_de': 1.0, 'min_liquidity': 1.5, 'points': 15},
             'fair': {'max_de': 2.0, 'min_liquidity': 1.0, 'points': 10},
-            'poor': {'max_de': float('inf'), 'min_liquidity': 0, 'points': 0}
+            'poor': {'max_de': _INF, 'min_liquidity': 0, 'points': 0}
         }
     },
     'cash_flow_quality': {
@@ -51,7 +62,7 @@ SCORING_FRAMEWORK = {
             'excellent': {'max_pe': 15, 'min_growth': 10, 'points': 20},
             'good': {'max_pe': 25, 'points': 15},
             'fair': {'max_pe': 35, 'points': 10},
-            'poor': {'max_pe': float('inf'), 'points': 5}
+            'poor': {'max_pe': _INF, 'points': 5}
         }
     }
 }
@@ -64,6 +75,19 @@ RECOMMENDATION_THRESHOLDS = {
     'avoid': {'min_score': 0, 'confidence': 'HIGH'}
 }
 
+# (min_score, result) pairs from the highest threshold down, formatted once
+_RECOMMENDATION_TIERS = tuple(sorted(
+    (
+        (config['min_score'], {
+            'recommendation': rec_type.upper().replace('_', ' '),
+            'confidence': config['confidence']
+        })
+        for rec_type, config in RECOMMENDATION_THRESHOLDS.items()
+    ),
+    key=lambda tier: tier[0],
+    reverse=True
+))
+
 # Financial Ratio Benchmarks
 RATIO_BENCHMARKS = {
     'profitability': {
@@ -97,7 +121,7 @@ RATIO_BENCHMARKS = {
             'excellent': 0.5,
             'good': 1.0,
             'fair': 2.0,
-            'poor': float('inf')
+            'poor': _INF
         },
         'interest_coverage': {
             'excellent': 10.0,
@@ -255,6 +279,13 @@ COMPANY_INFO_PATTERNS = {
     'outstanding_shares': ['shares', 'outstanding shares', 'shares outstanding', 'equity shares']
 }
 
+
+# Freeze the keyword lists as interned lowercase tuples so matching code never
+# has to lowercase or copy them
+SHEET_PATTERNS = {sys.intern(k): tuple(sys.intern(kw.lower()) for kw in v) for k, v in SHEET_PATTERNS.items()}
+METRIC_PATTERNS = {sys.intern(k): tuple(sys.intern(kw.lower()) for kw in v) for k, v in METRIC_PATTERNS.items()}
+COMPANY_INFO_PATTERNS = {sys.intern(k): tuple(sys.intern(kw.lower()) for kw in v) for k, v in COMPANY_INFO_PATTERNS.items()}
+
 # Output Configuration
 OUTPUT_CONFIG = {
     'json_indent': 2,
@@ -301,6 +332,39 @@ ANALYSIS_CONFIG = {
 }
 
 
+# Freeze the top-level tables so consumers can share them without defensive
+# copies; nested values stay plain dicts and must be treated as read-only too
+SCORING_FRAMEWORK = MappingProxyType(SCORING_FRAMEWORK)
+RECOMMENDATION_THRESHOLDS = MappingProxyType(RECOMMENDATION_THRESHOLDS)
+RATIO_BENCHMARKS = MappingProxyType(RATIO_BENCHMARKS)
+GROWTH_CLASSIFICATIONS = MappingProxyType(GROWTH_CLASSIFICATIONS)
+CASH_FLOW_INDICATORS = MappingProxyType(CASH_FLOW_INDICATORS)
+RISK_THRESHOLDS = MappingProxyType(RISK_THRESHOLDS)
+DATA_QUALITY_CONFIG = MappingProxyType(DATA_QUALITY_CONFIG)
+SHEET_PATTERNS = MappingProxyType(SHEET_PATTERNS)
+METRIC_PATTERNS = MappingProxyType(METRIC_PATTERNS)
+COMPANY_INFO_PATTERNS = MappingProxyType(COMPANY_INFO_PATTERNS)
+OUTPUT_CONFIG = MappingProxyType(OUTPUT_CONFIG)
+LOGGING_CONFIG = MappingProxyType(LOGGING_CONFIG)
+FILE_LIMITS = MappingProxyType(FILE_LIMITS)
+ANALYSIS_CONFIG = MappingProxyType(ANALYSIS_CONFIG)
+
+
+# Single-key views of the nested tables above, built once at import; the
+# tables are treated as read-only after this point
+_RATIO_BENCHMARKS_FLAT = {
+    (category, ratio, level): value
+    for category, ratios in RATIO_BENCHMARKS.items()
+    for ratio, levels in ratios.items()
+    for level, value in levels.items()
+}
+_SCORING_THRESHOLDS_FLAT = {
+    (category, level): threshold
+    for category, config in SCORING_FRAMEWORK.items()
+    for level, threshold in config['thresholds'].items()
+}
+
+
 def get_ratio_benchmark(category: str, ratio: str, level: str) -> float:
     """
     Get benchmark value for a specific ratio.
@@ -313,10 +377,7 @@ def get_ratio_benchmark(category: str, ratio: str, level: str) -> float:
     Returns:
         float: Benchmark value
     """
-    try:
-        return RATIO_BENCHMARKS[category][ratio][level]
-    except KeyError:
-        return 0.0
+    return _RATIO_BENCHMARKS_FLAT.get((category, ratio, level), 0.0)
 
 
 def get_scoring_threshold(category: str, level: str) -> Dict[str, Any]:
@@ -330,10 +391,116 @@ def get_scoring_threshold(category: str, level: str) -> Dict[str, Any]:
     Returns:
         Dict[str, Any]: Threshold configuration
     """
-    try:
-        return SCORING_FRAMEWORK[category]['thresholds'][level]
-    except KeyError:
-        return {}
+    return _SCORING_THRESHOLDS_FLAT.get((category, level), {})
+
+
+def _build_tier_cutoffs(category: str, key: str):
+    """
+    Build sorted cutoffs, points and growth gates for a single-metric category.
+    
+    Comparisons are strict, as in FinancialCalculator.calculate_investment_score:
+    'min_*' keys award a tier's points when the value is above its cutoff, and
+    values at or below every cutoff score 0; 'max_*' keys award a tier's points
+    when the value is below its cutoff. A tier's 'min_growth', if set, must also
+    be exceeded by the revenue CAGR, otherwise the next lower tier applies.
+    
+    Args:
+        category (str): SCORING_FRAMEWORK category
+        key (str): Threshold key holding the cutoff (e.g. 'min_cagr')
+        
+    Returns:
+        Tuple of (key, cutoffs, points, growth gates) with cutoffs in ascending
+        order; tiers without a growth gate hold -inf
+    """
+    tiers = sorted((t[key], t['points'], t.get('min_growth', -_INF))
+                   for t in SCORING_FRAMEWORK[category]['thresholds'].values())
+    return key, tuple(t[0] for t in tiers), tuple(t[1] for t in tiers), tuple(t[2] for t in tiers)
+
+
+# Cutoff/points tables for the categories FinancialCalculator scores on a single
+# metric (plus valuation's revenue-growth gate). profitability's improving/stable/
+# declining flags are not scored there either. cash_flow_quality (its top tier
+# also needs FCF/revenue > 5) and financial_health (D/E combined with liquidity)
+# are not covered
+SCORING_CUTOFFS = MappingProxyType({
+    'growth_quality': _build_tier_cutoffs('growth_quality', 'min_cagr'),
+    'profitability': _build_tier_cutoffs('profitability', 'min_npm'),
+    'valuation': _build_tier_cutoffs('valuation', 'max_pe'),
+})
+
+_SCORING_TIER_ARRAYS = {
+    category: (np.array(cutoffs, dtype=np.float64), np.array(points, dtype=np.int64),
+               np.array(growth_gates, dtype=np.float64))
+    for category, (_, cutoffs, points, growth_gates) in SCORING_CUTOFFS.items()
+}
+
+
+def score_metric(category: str, value: float, growth: float = math.nan) -> int:
+    """
+    Score one metric value against a category's numeric thresholds.
+    
+    Args:
+        category (str): A SCORING_CUTOFFS category
+        value (float): Metric value (CAGR, net profit margin or P/E)
+        growth (float): Revenue CAGR for tiers with a 'min_growth' gate; NaN
+            (the default) never passes a gate
+        
+    Returns:
+        int: Points for the matching tier. NaN fails every comparison and gets
+            the lowest tier, as in FinancialCalculator
+    """
+    key, cutoffs, points, growth_gates = SCORING_CUTOFFS[category]
+    if key.startswith('min_'):
+        if value != value:
+            return 0
+        tier, step = bisect_left(cutoffs, value) - 1, -1
+    else:
+        if value != value:
+            return points[-1]
+        tier, step = min(bisect_right(cutoffs, value), len(cutoffs) - 1), 1
+    
+    # A tier whose growth gate is not exceeded drops to the next lower tier
+    while 0 <= tier < len(cutoffs) and growth_gates[tier] != -_INF and not growth > growth_gates[tier]:
+        tier += step
+    return points[tier] if tier >= 0 else 0
+
+
+def score_metric_array(category: str, values, growth=math.nan) -> np.ndarray:
+    """
+    Score many metric values against a category's thresholds in one pass.
+    
+    Vectorized equivalent of score_metric, with the same strict boundaries.
+    
+    Args:
+        category (str): A SCORING_CUTOFFS category
+        values: Array-like of metric values, any shape
+        growth: Revenue CAGR per value (or one scalar) for tiers with a
+            'min_growth' gate; NaN never passes a gate
+        
+    Returns:
+        np.ndarray: Points per value, same shape as values
+    """
+    cutoffs, points, growth_gates = _SCORING_TIER_ARRAYS[category]
+    values = np.asarray(values, dtype=np.float64)
+    growth = np.broadcast_to(np.asarray(growth, dtype=np.float64), values.shape)
+    last = len(cutoffs) - 1
+    if SCORING_CUTOFFS[category][0].startswith('min_'):
+        tier = np.searchsorted(cutoffs, values, side='left') - 1
+        step, lowest = -1, 0
+    else:
+        tier = np.minimum(np.searchsorted(cutoffs, values, side='right'), last)
+        step, lowest = 1, points[-1]
+    
+    # A tier whose growth gate is not exceeded drops to the next lower tier
+    for _ in range(len(cutoffs)):
+        gate = growth_gates[np.clip(tier, 0, last)]
+        failed = (tier >= 0) & (tier <= last) & (gate != -_INF) & ~(growth > gate)
+        if not failed.any():
+            break
+        tier = np.where(failed, tier + step, tier)
+    
+    scores = np.where(tier >= 0, points[np.clip(tier, 0, last)], 0)
+    return np.where(np.isnan(values), lowest, scores)
 
 
 def get_recommendation_from_score(score: int) -> Dict[str, str]:
@@ -346,20 +513,23 @@ def get_recommendation_from_score(score: int) -> Dict[str, str]:
     Returns:
         Dict[str, str]: Recommendation and confidence level
     """
-    for rec_type, config in RECOMMENDATION_THRESHOLDS.items():
-        if score >= config['min_score']:
-            return {
-                'recommendation': rec_type.upper().replace('_', ' '),
-                'confidence': config['confidence']
-            }
+    for min_score, recommendation in _RECOMMENDATION_TIERS:
+        if score >= min_score:
+            return dict(recommendation)
     
     return {'recommendation': 'AVOID', 'confidence': 'HIGH'}
 
 
+_TOTAL_WEIGHT = sum(cat['weight'] for cat in SCORING_FRAMEWORK.values())
+
+
+@lru_cache(maxsize=None)
 def validate_configuration() -> bool:
     """
     Validate that all configuration values are properly set.
     
+    The tables are frozen, so the result is computed once and reused.
+    
     Returns:
         bool: True if configuration is valid
     """
@@ -376,13 +546,10 @@ def validate_configuration() -> bool:
             return False
     
     # Validate scoring framework totals to 100
-    total_weight = sum(cat['weight'] for cat in SCORING_FRAMEWORK.values())
-    if total_weight != 100:
-        return False
-    
-    return True
+    return _TOTAL_WEIGHT == 100
 
 
-# Initialize configuration validation
-if not validate_configuration():
+# Initialize configuration validation; compiled out under python -O, where the
+# tables are trusted as shipped
+if __debug__ and not validate_configuration():
     raise ValueError("Configuration validation failed. Please check config values.")
\ No newline at end of file
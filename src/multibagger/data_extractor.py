@@ -11,10 +11,106 @@ from typing import Dict, List, Optional, Tuple, Any
 import logging
 import re
 import os
-from datetime import datetime
+from collections.abc import Mapping
+from datetime import date, datetime, time
+from functools import lru_cache
 
 logger = logging.getLogger(__name__)
 
+# Four-digit years from 1900-2099 as a standalone token
+_YEAR_RE = re.compile(r'\b(19|20)\d{2}\b')
+
+# Quarter labels (Q1-Q4) or quarter-end month names in an upper-cased cell
+_QUARTER_RE = re.compile(r'Q[1-4]|MAR|JUN|SEP|DEC')
+
+# Quarter-end month-day for Q1-Q4 (Mar-31, Jun-30, Sep-30, Dec-31), used to
+# build placeholder dates for time-only quarter header cells
+_QUARTER_END_DATES = ('03-31', '06-30', '09-30', '12-31')
+
+# Header rows sit near the top of a sheet; scan this many rows before the rest
+_HEADER_SCAN_ROWS = 25
+
+# Corporate suffixes marking a column header as the company name (upper-cased, substring match)
+_COMPANY_NAME_RE = re.compile(r'LTD|LIMITED|INC|CORP|COMPANY|INFORMATICS')
+
+# Column headers Screener exports use that never hold the company name
+_GENERIC_HEADERS = frozenset({'SCREENER.IN', 'Narration'})
+
+# Common words ignored when fuzzy-matching row labels
+_FILLER_WORDS = frozenset({'from', 'to', 'the', 'and', 'or', 'of', 'in', 'for', 'with', 'total'})
+
+
+@lru_cache(maxsize=None)
+def _keyword_pattern(keywords: Tuple[str, ...]) -> 're.Pattern':
+    """
+    Compile keywords into one regex alternation matching any of them as a substring.
+    
+    Args:
+        keywords (Tuple[str, ...]): Keywords to match, compared case-insensitively
+        
+    Returns:
+        re.Pattern: Pattern to search against a lower-cased sheet name
+    """
+    return re.compile('|'.join(re.escape(keyword.lower()) for keyword in keywords))
+
+
+def _select_excel_engine() -> str:
+    """
+    Pick the fastest available pandas engine for reading .xlsx files.
+    
+    Returns:
+        str: 'calamine' if python-calamine is installed and pandas supports it,
+            otherwise 'openpyxl'
+    """
+    try:
+        import python_calamine  # noqa: F401
+    except ImportError:
+        return 'openpyxl'
+    
+    # pandas gained the calamine engine in 2.2. Only the leading major.minor
+    # is matched so pre-releases like '3.0rc0' parse; anything else falls back
+    match = re.match(r'(\d+)\.(\d+)', pd.__version__)
+    if not match:
+        return 'openpyxl'
+    return 'calamine' if (int(match.group(1)), int(match.group(2))) >= (2, 2) else 'openpyxl'
+
+
+EXCEL_ENGINE = _select_excel_engine()
+
+
+class _LazySheets(Mapping):
+    """
+    Read-only mapping of sheet name -> DataFrame that parses each sheet on first access.
+    
+    Sheets no extractor asks for (e.g. Customization) are never parsed. The
+    underlying ExcelFile stays open until close() is called.
+    """
+    
+    def __init__(self, excel_file: pd.ExcelFile):
+        self._excel_file = excel_file
+        self._names = list(excel_file.sheet_names)
+        self._parsed = {}
+        self._closed = False
+    
+    def __getitem__(self, name: str) -> pd.DataFrame:
+        if name not in self._parsed:
+            if name not in self._names:
+                raise KeyError(name)
+            self._parsed[name] = self._excel_file.parse(name)
+        return self._parsed[name]
+    
+    def __iter__(self):
+        return iter(self._names)
+    
+    def __len__(self) -> int:
+        return len(self._names)
+    
+    def close(self) -> None:
+        """Close the workbook (safe to call twice); sheets parsed so far remain available."""
+        if not self._closed:
+            self._excel_file.close()
+            self._closed = True
+
 
 class ExcelDataExtractor:
     """
@@ -32,6 +128,25 @@ class ExcelDataExtractor:
         self.workbook = None
         self.sheets = {}
         self.extracted_data = {}
+        # id(sheet) -> (sheet, index labels, lowercase labels, label word sets)
+        self._label_cache = {}
+        # id(sheet) -> (sheet, year row index, years)
+        self._year_header_cache = {}
+    
+    def __enter__(self) -> 'ExcelDataExtractor':
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+    
+    def close(self) -> None:
+        """
+        Close the workbook opened by load_workbook, if any.
+        
+        Sheets parsed so far remain available in self.sheets.
+        """
+        if isinstance(self.sheets, _LazySheets):
+            self.sheets.close()
         
     def load_workbook(self) -> bool:
         """
@@ -46,11 +161,16 @@ class ExcelDataExtractor:
                 logger.error(f"Excel file not found: {self.excel_path}")
                 return False
             
-            # Read all sheets from the Excel file
-            self.workbook = pd.read_excel(self.excel_path, sheet_name=None, engine='openpyxl')
+            # Open the workbook once so the archive and shared strings are parsed
+            # once, and parse each sheet only when an extractor first reads it.
+            # Calamine streams the sheet XML; the openpyxl fallback opens the
+            # workbook with read_only=True, data_only=True and keep_links=False,
+            # so cells are streamed without styles or formulas.
+            self.workbook = _LazySheets(pd.ExcelFile(self.excel_path, engine=EXCEL_ENGINE))
             self.sheets = self.workbook
             
             if not self.sheets:
+                self.close()
                 logger.error("No sheets found in the workbook")
                 return False
                 
@@ -76,26 +196,40 @@ class ExcelDataExtractor:
         Returns:
             Optional[int]: Row index containing years, None if not found
         """
-        for idx, row in sheet_data.iterrows():
+        for idx, row in self._iter_header_candidate_rows(sheet_data):
             # Look for cells containing 4-digit years (datetime objects or strings)
             year_count = 0
-            for cell in row:
-                if pd.notna(cell):
-                    # Check if it's a datetime object (including datetime.datetime and pd.Timestamp)
-                    if hasattr(cell, 'year'):
-                        year = cell.year
-                        if 1990 <= year <= 2030:  # Reasonable year range
-                            year_count += 1
-                    # Check string/numeric for year patterns
-                    elif isinstance(cell, (int, float, str)):
-                        cell_str = str(cell)
-                        if re.search(r'\b(19|20)\d{2}\b', cell_str):
-                            year_count += 1
+            for cell in row[pd.notna(row)]:
+                # Check if it's a date object (datetime.date/datetime and pd.Timestamp);
+                # isinstance avoids a failing attribute lookup on every number and string
+                if isinstance(cell, date):
+                    year = cell.year
+                    if 1990 <= year <= 2030:  # Reasonable year range
+                        year_count += 1
+                # Check string/numeric for year patterns
+                elif isinstance(cell, (int, float, str)):
+                    cell_str = str(cell)
+                    if _YEAR_RE.search(cell_str):
+                        year_count += 1
             
             if year_count >= 3:  # At least 3 years found
                 return idx
         return None
     
+    def _iter_header_candidate_rows(self, sheet_data: pd.DataFrame):
+        """
+        Yield (index label, object row array) pairs in sheet order.
+        
+        The first _HEADER_SCAN_ROWS rows are converted on their own, so a header
+        found near the top never pays for converting the rest of the sheet.
+        iterrows() is avoided because it builds a Series per row.
+        
+        Args:
+            sheet_data (pd.DataFrame): The sheet data
+        """
+        for block in (sheet_data.iloc[:_HEADER_SCAN_ROWS], sheet_data.iloc[_HEADER_SCAN_ROWS:]):
+            yield from zip(block.index, block.to_numpy(dtype=object))
+    
     def extract_years(self, year_row: pd.Series) -> List[int]:
         """
         Extract year values from a row.
@@ -109,15 +243,15 @@ class ExcelDataExtractor:
         years = []
         for cell in year_row:
             if pd.notna(cell):
-                # Handle datetime objects (including datetime.datetime and pd.Timestamp)
-                if hasattr(cell, 'year'):
+                # Handle date objects (datetime.date/datetime and pd.Timestamp)
+                if isinstance(cell, date):
                     year = cell.year
                     if 1990 <= year <= 2030:  # Reasonable year range
                         years.append(year)
                 # Handle string/numeric representations
                 else:
                     cell_str = str(cell)
-                    year_match = re.search(r'\b(19|20)(\d{2})\b', cell_str)
+                    year_match = _YEAR_RE.search(cell_str)
                     if year_match:
                         year = int(year_match.group(0))
                         if 1990 <= year <= 2030:  # Reasonable year range
@@ -135,35 +269,96 @@ class ExcelDataExtractor:
         Returns:
             Optional[int]: Row index if found, None otherwise
         """
-        label_lower = label.lower().strip()
+        return self.find_rows_by_labels(sheet_data, [label])[label]
+    
+    def find_rows_by_labels(self, sheet_data: pd.DataFrame, labels: List[str]) -> Dict[str, Optional[int]]:
+        """
+        Find the row index of several labels in a single pass over the first column.
         
-        for idx, row in sheet_data.iterrows():
-            first_cell = row.iloc[0] if len(row) > 0 else None
-            if pd.notna(first_cell):
-                cell_str = str(first_cell).lower().strip()
-                
-                # Exact match
-                if label_lower == cell_str:
-                    return idx
-                
-                # Substring match
+        Each label resolves to the first row that matches it, using the same rules
+        as find_row_by_label.
+        
+        Args:
+            sheet_data (pd.DataFrame): The sheet data
+            labels (List[str]): Labels to search for
+            
+        Returns:
+            Dict[str, Optional[int]]: Row index per label, None if not found
+        """
+        found = dict.fromkeys(labels)
+        pending = {}
+        for label in found:
+            label_lower = label.lower().strip()
+            label_words = set(label_lower.replace('-', ' ').split()) - _FILLER_WORDS
+            pending[label] = (label_lower, label_words, min(len(label_words), 2))
+        
+        _, index, cell_strs, cell_word_sets = self._get_label_index(sheet_data)
+        for idx, cell_str, cell_words in zip(index, cell_strs, cell_word_sets):
+            if not pending:
+                break
+            if cell_str is None:
+                continue
+            
+            for label, (label_lower, label_words, min_overlap) in list(pending.items()):
+                # Exact or substring match in either direction
                 if label_lower in cell_str or cell_str in label_lower:
-                    return idx
-                    
-                # Fuzzy matching - remove common words and check key terms
-                cell_words = set(cell_str.replace('-', ' ').split())
-                label_words = set(label_lower.replace('-', ' ').split())
-                
-                # Remove common filler words
-                filler_words = {'from', 'to', 'the', 'and', 'or', 'of', 'in', 'for', 'with', 'total'}
-                cell_words = cell_words - filler_words
-                label_words = label_words - filler_words
+                    matched = True
+                # Fuzzy matching - check key terms with filler words removed
+                else:
+                    matched = bool(label_words and cell_words and len(label_words & cell_words) >= min_overlap)
                 
-                # Check if key words match
-                if label_words and cell_words and len(label_words & cell_words) >= min(len(label_words), 2):
-                    return idx
+                if matched:
+                    found[label] = idx
+                    del pending[label]
                     
-        return None
+        return found
+    
+    def _get_year_header(self, sheet_data: pd.DataFrame) -> Tuple[Optional[int], List[int]]:
+        """
+        Get the year header row and its years, computed once per sheet.
+        
+        Args:
+            sheet_data (pd.DataFrame): The sheet data
+            
+        Returns:
+            Tuple[Optional[int], List[int]]: Year row index (None if not found) and years
+        """
+        cached = self._year_header_cache.get(id(sheet_data))
+        if cached is not None and cached[0] is sheet_data:
+            return cached[1], cached[2]
+        
+        year_row_idx = self.find_year_row(sheet_data)
+        years = self.extract_years(sheet_data.iloc[year_row_idx]) if year_row_idx is not None else []
+        self._year_header_cache[id(sheet_data)] = (sheet_data, year_row_idx, years)
+        return year_row_idx, years
+    
+    def _get_label_index(self, sheet_data: pd.DataFrame) -> Tuple[pd.DataFrame, list, list, list]:
+        """
+        Get the normalized first-column labels of a sheet, computed once per sheet.
+        
+        Args:
+            sheet_data (pd.DataFrame): The sheet data
+            
+        Returns:
+            Tuple of the sheet, its index labels, lowercase stripped labels (None
+            for empty cells) and label word sets without filler words
+        """
+        cached = self._label_cache.get(id(sheet_data))
+        # The sheet is kept in the entry so a recycled id() cannot match
+        if cached is not None and cached[0] is sheet_data:
+            return cached
+        
+        if sheet_data.shape[1] == 0:
+            cell_strs = [None] * len(sheet_data)
+        else:
+            cell_strs = [str(cell).lower().strip() if pd.notna(cell) else None
+                         for cell in sheet_data.iloc[:, 0].to_numpy(dtype=object)]
+        cell_word_sets = [set(cell_str.replace('-', ' ').split()) - _FILLER_WORDS if cell_str is not None else None
+                          for cell_str in cell_strs]
+        
+        cached = (sheet_data, list(sheet_data.index), cell_strs, cell_word_sets)
+        self._label_cache[id(sheet_data)] = cached
+        return cached
     
     def extract_numeric_values(self, row: pd.Series, years: List[int]) -> Dict[int, float]:
         """
@@ -176,20 +371,28 @@ class ExcelDataExtractor:
         Returns:
             Dict[int, float]: Dictionary mapping years to values
         """
-        values = {}
-        # Skip first column (label) and extract values
-        for i, year in enumerate(years):
-            try:
-                if i + 1 < len(row):
-                    value = row.iloc[i + 1]
-                    if pd.notna(value) and isinstance(value, (int, float)):
-                        values[year] = float(value)
-                    else:
-                        values[year] = 0.0
-                else:
-                    values[year] = 0.0
-            except (ValueError, IndexError):
-                values[year] = 0.0
+        return dict(zip(years, self._extract_row_numbers(row, len(years))))
+    
+    def _extract_row_numbers(self, row: pd.Series, count: int) -> List[float]:
+        """
+        Extract the first `count` values after the label cell as floats.
+        
+        Only real numbers are kept; NaN, text, dates and cells beyond the end of
+        the row become 0.0.
+        
+        Args:
+            row (pd.Series): Data row
+            count (int): Number of values to extract
+            
+        Returns:
+            List[float]: Extracted values
+        """
+        # Skip first column (label); slice the raw array once instead of iloc per cell
+        cells = row.to_numpy()[1:count + 1]
+        # value == value filters out NaN
+        values = [float(value) if isinstance(value, (int, float)) and value == value else 0.0
+                  for value in cells]
+        values.extend([0.0] * (count - len(values)))
         return values
     
     def extract_from_profit_loss_sheet(self) -> Dict[str, Any]:
@@ -205,14 +408,12 @@ class ExcelDataExtractor:
             return {}
         
         sheet_data = self.sheets[sheet_name]
-        year_row_idx = self.find_year_row(sheet_data)
+        year_row_idx, years = self._get_year_header(sheet_data)
         
         if year_row_idx is None:
             logger.warning("Year row not found in Profit & Loss sheet")
             return {}
         
-        years = self.extract_years(sheet_data.iloc[year_row_idx])
-        
         # Define metrics to extract
         metrics = {
             'sales': ['sales', 'revenue', 'total revenue', 'net sales'],
@@ -224,10 +425,13 @@ class ExcelDataExtractor:
         
         extracted = {'years': years}
         
+        # Resolve every search term in one pass over the label column
+        term_rows = self.find_rows_by_labels(sheet_data, [term for terms in metrics.values() for term in terms])
+        
         for metric_key, search_terms in metrics.items():
             found = False
             for term in search_terms:
-                row_idx = self.find_row_by_label(sheet_data, term)
+                row_idx = term_rows[term]
                 if row_idx is not None:
                     values = self.extract_numeric_values(sheet_data.iloc[row_idx], years)
                     extracted[metric_key] = values
@@ -253,14 +457,12 @@ class ExcelDataExtractor:
             return {}
         
         sheet_data = self.sheets[sheet_name]
-        year_row_idx = self.find_year_row(sheet_data)
+        year_row_idx, years = self._get_year_header(sheet_data)
         
         if year_row_idx is None:
             logger.warning("Year row not found in Balance Sheet")
             return {}
         
-        years = self.extract_years(sheet_data.iloc[year_row_idx])
-        
         # Define balance sheet metrics with comprehensive search terms
         metrics = {
             'total_equity': ['total equity', 'shareholders equity', 'equity', 'equity share capital'],
@@ -274,24 +476,28 @@ class ExcelDataExtractor:
         extracted = {'years': years}
         used_rows = set()  # Track which rows have been used to prevent duplicates
         
+        # Resolve every search term in one pass over the label column
+        term_rows = self.find_rows_by_labels(sheet_data, [term for terms in metrics.values() for term in terms])
+        
         for metric_key, search_terms in metrics.items():
             found = False
             matched_term = None
             matched_row = None
             
             for term in search_terms:
-                row_idx = self.find_row_by_label(sheet_data, term)
+                row_idx = term_rows[term]
                 if row_idx is not None and row_idx not in used_rows:
-                    values = self.extract_numeric_values(sheet_data.iloc[row_idx], years)
+                    row = sheet_data.iloc[row_idx]  # Build the row Series once
+                    values = self.extract_numeric_values(row, years)
                     extracted[metric_key] = values
                     used_rows.add(row_idx)  # Mark this row as used
                     found = True
                     matched_term = term
-                    matched_row = str(sheet_data.iloc[row_idx].iloc[0])
+                    matched_row = str(row.iloc[0])
                     logger.info(f"Balance Sheet: '{metric_key}' mapped to '{matched_row}' using search term '{matched_term}'")
                     break
                 elif row_idx is not None and row_idx in used_rows:
-                    logger.debug(f"Balance Sheet: Row {row_idx} ('{str(sheet_data.iloc[row_idx].iloc[0])}') already used, skipping for '{metric_key}'")
+                    logger.debug(f"Balance Sheet: Row {row_idx} ('{str(sheet_data.iat[row_idx, 0])}') already used, skipping for '{metric_key}'")
             
             if not found:
                 extracted[metric_key] = {year: 0.0 for year in years}
@@ -300,29 +506,22 @@ class ExcelDataExtractor:
         # Calculate total_assets if not found directly
         if 'total_assets' in extracted and all(v == 0.0 for v in extracted['total_assets'].values()):
             logger.info("Balance Sheet: Attempting to calculate total_assets from components")
-            calculated_total_assets = {}
             
-            for year in years:
-                # Try to calculate as current_assets + fixed_assets
-                current_assets = extracted.get('current_assets', {}).get(year, 0)
-                fixed_assets = extracted.get('fixed_assets', {}).get(year, 0)
-                
-                # Also check if we can use total_debt + total_equity (balance equation)
-                total_debt = extracted.get('total_debt', {}).get(year, 0)
-                total_equity = extracted.get('total_equity', {}).get(year, 0)
-                
-                # Use the larger of the two methods (more reliable)
-                method1 = current_assets + fixed_assets  # Assets = Current + Fixed
-                method2 = total_debt + total_equity      # Assets = Liabilities + Equity
-                
-                if method2 > 0 and method2 > method1:
-                    calculated_total_assets[year] = method2
-                    logger.debug(f"Balance Sheet: Year {year} - using debt+equity method: {method2}")
-                elif method1 > 0:
-                    calculated_total_assets[year] = method1
-                    logger.debug(f"Balance Sheet: Year {year} - using current+fixed assets method: {method1}")
-                else:
-                    calculated_total_assets[year] = 0.0
+            def year_values(metric_key: str) -> np.ndarray:
+                metric_values = extracted.get(metric_key, {})
+                return np.array([metric_values.get(year, 0.0) for year in years], dtype=np.float64)
+            
+            # Assets = Current + Fixed, or Assets = Liabilities + Equity (balance equation);
+            # inf cells may yield NaN, which then fails both comparisons as in plain floats
+            with np.errstate(invalid='ignore'):
+                method1 = year_values('current_assets') + year_values('fixed_assets')
+                method2 = year_values('total_debt') + year_values('total_equity')
+            
+            # Use the larger of the two methods (more reliable), 0.0 if neither is positive
+            use_method2 = (method2 > 0) & (method2 > method1)
+            total_assets = np.where(use_method2, method2, np.where(method1 > 0, method1, 0.0))
+            calculated_total_assets = dict(zip(years, total_assets.tolist()))
+            logger.debug(f"Balance Sheet: debt+equity method used for {int(use_method2.sum())}/{len(years)} years")
             
             # Update total_assets if we got meaningful values
             if any(v > 0 for v in calculated_total_assets.values()):
@@ -345,14 +544,12 @@ class ExcelDataExtractor:
             return {}
         
         sheet_data = self.sheets[sheet_name]
-        year_row_idx = self.find_year_row(sheet_data)
+        year_row_idx, years = self._get_year_header(sheet_data)
         
         if year_row_idx is None:
             logger.warning("Year row not found in Cash Flow sheet")
             return {}
         
-        years = self.extract_years(sheet_data.iloc[year_row_idx])
-        
         # Define cash flow metrics with comprehensive search terms
         metrics = {
             'operating_cash_flow': ['operating cash flow', 'cash from operations', 'ocf', 'cash from operating activity', 'operating activity'],
@@ -363,24 +560,28 @@ class ExcelDataExtractor:
         extracted = {'years': years}
         used_rows = set()  # Track which rows have been used to prevent duplicates
         
+        # Resolve every search term in one pass over the label column
+        term_rows = self.find_rows_by_labels(sheet_data, [term for terms in metrics.values() for term in terms])
+        
         for metric_key, search_terms in metrics.items():
             found = False
             matched_term = None
             matched_row = None
             
             for term in search_terms:
-                row_idx = self.find_row_by_label(sheet_data, term)
+                row_idx = term_rows[term]
                 if row_idx is not None and row_idx not in used_rows:
-                    values = self.extract_numeric_values(sheet_data.iloc[row_idx], years)
+                    row = sheet_data.iloc[row_idx]  # Build the row Series once
+                    values = self.extract_numeric_values(row, years)
                     extracted[metric_key] = values
                     used_rows.add(row_idx)  # Mark this row as used
                     found = True
                     matched_term = term
-                    matched_row = str(sheet_data.iloc[row_idx].iloc[0])
+                    matched_row = str(row.iloc[0])
                     logger.info(f"Cash Flow: '{metric_key}' mapped to '{matched_row}' using search term '{matched_term}'")
                     break
                 elif row_idx is not None and row_idx in used_rows:
-                    logger.debug(f"Cash Flow: Row {row_idx} ('{str(sheet_data.iloc[row_idx].iloc[0])}') already used, skipping for '{metric_key}'")
+                    logger.debug(f"Cash Flow: Row {row_idx} ('{str(sheet_data.iat[row_idx, 0])}') already used, skipping for '{metric_key}'")
             
             if not found:
                 extracted[metric_key] = {year: 0.0 for year in years}
@@ -388,11 +589,12 @@ class ExcelDataExtractor:
         
         # Calculate free cash flow
         if 'operating_cash_flow' in extracted and 'capex' in extracted:
-            extracted['free_cash_flow'] = {}
-            for year in years:
-                ocf = extracted['operating_cash_flow'].get(year, 0)
-                capex = abs(extracted['capex'].get(year, 0))  # Capex is usually negative
-                extracted['free_cash_flow'][year] = ocf - capex
+            ocf = np.array([extracted['operating_cash_flow'].get(year, 0.0) for year in years], dtype=np.float64)
+            capex = np.array([extracted['capex'].get(year, 0.0) for year in years], dtype=np.float64)
+            # Capex is usually negative
+            with np.errstate(invalid='ignore'):
+                free_cash_flow = ocf - np.abs(capex)
+            extracted['free_cash_flow'] = dict(zip(years, free_cash_flow.tolist()))
         
         # Validate cash flow data quality - check for identical values indicating mapping errors
         if 'operating_cash_flow' in extracted and 'capex' in extracted:
@@ -429,41 +631,25 @@ class ExcelDataExtractor:
         quarter_row_idx = None
         quarters = []
         
-        for idx, row in sheet_data.iterrows():
-            quarter_count = 0
+        for idx, row in self._iter_header_candidate_rows(sheet_data):
             row_quarters = []
-            for cell in row:
-                if pd.notna(cell):
-                    # Handle datetime objects for quarters (including datetime.datetime and pd.Timestamp)
-                    if hasattr(cell, 'strftime'):
-                        # Check if it's a valid date (not just time like 00:00:00)
-                        if hasattr(cell, 'year') and cell.year > 1900:  # Valid year
-                            quarter_count += 1
-                            row_quarters.append(cell.strftime('%Y-%m-%d'))
-                        else:
-                            # Handle time-only cells like "00:00:00" by creating placeholder dates
-                            quarter_count += 1
-                            quarter_num = len(row_quarters) % 4  # 0,1,2,3 for Q1,Q2,Q3,Q4
-                            placeholder_year = 2020 + (len(row_quarters) // 4)  # Increment year every 4 quarters
-                            
-                            # Use proper quarter-end dates: Q1=Mar-31, Q2=Jun-30, Q3=Sep-30, Q4=Dec-31
-                            if quarter_num == 0:  # Q1
-                                quarter_date = f"{placeholder_year:04d}-03-31"
-                            elif quarter_num == 1:  # Q2  
-                                quarter_date = f"{placeholder_year:04d}-06-30"
-                            elif quarter_num == 2:  # Q3
-                                quarter_date = f"{placeholder_year:04d}-09-30"
-                            else:  # Q4
-                                quarter_date = f"{placeholder_year:04d}-12-31"
-                            
-                            row_quarters.append(quarter_date)
+            for cell in row[pd.notna(row)]:
+                # Handle date/time objects for quarters (datetime.date/datetime/time and pd.Timestamp)
+                if isinstance(cell, (date, time)):
+                    # Check if it's a valid date (not just time like 00:00:00)
+                    if isinstance(cell, date) and cell.year > 1900:  # Valid year
+                        row_quarters.append(cell.strftime('%Y-%m-%d'))
                     else:
-                        cell_str = str(cell).upper()
-                        if re.search(r'Q[1-4]', cell_str) or 'MAR' in cell_str or 'JUN' in cell_str or 'SEP' in cell_str or 'DEC' in cell_str:
-                            quarter_count += 1
-                            row_quarters.append(cell_str)
+                        # Handle time-only cells like "00:00:00" by creating placeholder
+                        # quarter-end dates, incrementing the year every 4 quarters
+                        placeholder_year = 2020 + (len(row_quarters) // 4)
+                        row_quarters.append(f"{placeholder_year:04d}-{_QUARTER_END_DATES[len(row_quarters) % 4]}")
+                else:
+                    cell_str = str(cell).upper()
+                    if _QUARTER_RE.search(cell_str):
+                        row_quarters.append(cell_str)
             
-            if quarter_count >= 4:  # At least 4 quarters
+            if len(row_quarters) >= 4:  # At least 4 quarters
                 quarter_row_idx = idx
                 quarters = row_quarters
                 break
@@ -483,26 +669,15 @@ class ExcelDataExtractor:
         
         extracted = {'quarters': quarters}
         
+        # Resolve every search term in one pass over the label column
+        term_rows = self.find_rows_by_labels(sheet_data, [term for terms in metrics.values() for term in terms])
+        
         for metric_key, search_terms in metrics.items():
             found = False
             for term in search_terms:
-                row_idx = self.find_row_by_label(sheet_data, term)
+                row_idx = term_rows[term]
                 if row_idx is not None:
-                    values = []
-                    for i in range(len(quarters)):
-                        try:
-                            if i + 1 < len(sheet_data.iloc[row_idx]):
-                                value = sheet_data.iloc[row_idx].iloc[i + 1]
-                                if pd.notna(value) and isinstance(value, (int, float)):
-                                    values.append(float(value))
-                                else:
-                                    values.append(0.0)
-                            else:
-                                values.append(0.0)
-                        except (ValueError, IndexError):
-                            values.append(0.0)
-                    
-                    extracted[metric_key] = values
+                    extracted[metric_key] = self._extract_row_numbers(sheet_data.iloc[row_idx], len(quarters))
                     found = True
                     break
             
@@ -566,10 +741,13 @@ class ExcelDataExtractor:
             'outstanding_shares': ['shares', 'outstanding shares', 'shares outstanding', 'number of shares']
         }
         
+        # Resolve every search term in one pass over the label column
+        term_rows = self.find_rows_by_labels(sheet_data, [term for terms in company_fields.values() for term in terms])
+        
         for field_key, search_terms in company_fields.items():
             found = False
             for term in search_terms:
-                row_idx = self.find_row_by_label(sheet_data, term)
+                row_idx = term_rows[term]
                 if row_idx is not None:
                     # Look for value in adjacent cells
                     row = sheet_data.iloc[row_idx]
@@ -607,11 +785,12 @@ class ExcelDataExtractor:
         Returns:
             Optional[str]: Sheet name if found, None otherwise
         """
+        if not keywords:
+            return None
+        pattern = _keyword_pattern(tuple(keywords))
         for sheet_name in self.sheets.keys():
-            sheet_name_lower = sheet_name.lower()
-            for keyword in keywords:
-                if keyword.lower() in sheet_name_lower:
-                    return sheet_name
+            if pattern.search(sheet_name.lower()):
+                return sheet_name
         return None
     
     def _extract_company_name_from_headers(self) -> Optional[str]:
@@ -623,20 +802,19 @@ class ExcelDataExtractor:
         """
         try:
             # Check all sheets for company name in column headers
-            for sheet_name, sheet_data in self.sheets.items():
-                # Skip customization sheets
+            for sheet_name in self.sheets:
+                # Skip customization sheets (without parsing them)
                 if 'custom' in sheet_name.lower():
                     continue
                     
-                for col in sheet_data.columns:
+                for col in self.sheets[sheet_name].columns:
                     col_str = str(col).strip()
                     # Skip generic column names
-                    if col_str.startswith('Unnamed:') or col_str in ['SCREENER.IN', 'Narration']:
+                    if col_str.startswith('Unnamed:') or col_str in _GENERIC_HEADERS:
                         continue
                     
                     # Look for company name patterns
-                    if (len(col_str) > 5 and 
-                        any(keyword in col_str.upper() for keyword in ['LTD', 'LIMITED', 'INC', 'CORP', 'COMPANY', 'INFORMATICS'])):
+                    if len(col_str) > 5 and _COMPANY_NAME_RE.search(col_str.upper()):
                         logger.info(f"Found company name in {sheet_name} headers: {col_str}")
                         return col_str
                         
@@ -656,19 +834,48 @@ class ExcelDataExtractor:
         if not self.load_workbook():
             return {}
         
-        self.extracted_data = {
-            'company_info': self.extract_from_data_sheet(),
-            'profit_loss': self.extract_from_profit_loss_sheet(),
-            'balance_sheet': self.extract_from_balance_sheet(),
-            'cash_flow': self.extract_from_cash_flow_sheet(),
-            'quarterly': self.extract_from_quarters_sheet(),
-            'extraction_timestamp': datetime.now().isoformat()
-        }
+        try:
+            self.extracted_data = {
+                'company_info': self.extract_from_data_sheet(),
+                'profit_loss': self.extract_from_profit_loss_sheet(),
+                'balance_sheet': self.extract_from_balance_sheet(),
+                'cash_flow': self.extract_from_cash_flow_sheet(),
+                'quarterly': self.extract_from_quarters_sheet(),
+                'extraction_timestamp': datetime.now().isoformat()
+            }
+        finally:
+            self.close()
         
         logger.info("Data extraction completed successfully")
         return self.extracted_data
 
 
+def metrics_to_arrays(section: Dict[str, Any], dtype=np.float64) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+    """
+    Convert an extracted annual section into aligned numpy arrays.
+    
+    The extractor's {year: value} dicts are kept as the canonical output; this
+    columnar view is for vectorized consumers. Pass dtype=np.float32 to halve
+    memory when ~7 significant digits are enough.
+    
+    Args:
+        section (Dict[str, Any]): Extracted section with a 'years' list and
+            per-metric {year: value} dicts (e.g. extracted['profit_loss'])
+        dtype: Value dtype, float64 by default
+        
+    Returns:
+        Tuple of the years as an int16 array and one value array per metric,
+        aligned to the years (missing years are 0.0)
+    """
+    years = section.get('years', [])
+    arrays = {
+        metric: np.fromiter((values.get(year, 0.0) for year in years), dtype=dtype, count=len(years))
+        for metric, values in section.items()
+        if metric != 'years' and isinstance(values, dict)
+    }
+    return np.asarray(years, dtype=np.int16), arrays
+
+
 def extract_financial_data(excel_path: str) -> Dict[str, Any]:
     """
     Convenience function to extract all financial data from an Excel workbook.
@@ -9,7 +9,7 @@ the results to JSON files for AI agent consumption.
 import os
 import logging
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 from pathlib import Path
 
 from .data_extractor import ExcelDataExtractor
@@ -442,14 +442,34 @@ def analyze_stock_workbook(excel_path: str, log_level: str = "INFO") -> Optional
         ... else:
         ...     print("Analysis failed")
     """
+    result = analyze_stock_workbook_with_data(excel_path, log_level)
+    return result[0] if result else None
+
+
+def analyze_stock_workbook_with_data(excel_path: str, log_level: str = "INFO") -> Optional[Tuple[str, Dict[str, Any]]]:
+    """
+    Analyze a stock Excel workbook and return the JSON file path with the analysis data.
+    
+    Lets callers that post-process the analysis use the in-memory result instead
+    of reading the JSON file back.
+    
+    Args:
+        excel_path (str): Path to the Excel workbook containing financial data
+        log_level (str): Logging level (DEBUG, INFO, WARNING, ERROR)
+        
+    Returns:
+        Optional[Tuple[str, Dict[str, Any]]]: JSON file path and analysis data, None if failed
+    """
     try:
         # Create analyzer instance
         analyzer = StockAnalyzer(excel_path, log_level)
         
         # Run complete analysis
         result_path = analyzer.run_complete_analysis()
+        if not result_path:
+            return None
         
-        return result_path
+        return result_path, analyzer.final_analysis
         
     except Exception as e:
         logger.error(f"Critical error in analyze_stock_workbook: {str(e)}")
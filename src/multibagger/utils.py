@@ -5,15 +5,30 @@ This module provides utility functions for file handling, JSON operations,
 date/time utilities, and other helper functions for the stock analysis system.
 """
 
+import hashlib
 import json
 import os
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any, Optional
 import logging
 
+try:
+    import orjson
+except ImportError:  # optional speedup, installed with the "fast" extra
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Same layout as json.dump(indent=2, ensure_ascii=False). Values differ from the
+# json fallback in two cases: NaN/inf become null (json writes NaN/Infinity), and
+# numpy integers and bools become JSON numbers/booleans (default=str makes strings)
+ORJSON_DUMP_OPTIONS = (
+    orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+    if orjson else 0
+)
+
 
 def ensure_directory_exists(directory_path: str) -> bool:
     """
@@ -67,6 +82,24 @@ def get_reports_directory() -> str:
     return reports_dir
 
 
+def dump_report(data: Dict[str, Any]) -> bytes:
+    """
+    Serialize analysis data to indented UTF-8 JSON.
+    
+    Uses orjson when installed and falls back to the standard json module;
+    see ORJSON_DUMP_OPTIONS for where the two outputs differ.
+    
+    Args:
+        data (Dict[str, Any]): Analysis data to serialize
+        
+    Returns:
+        bytes: JSON document
+    """
+    if orjson:
+        return orjson.dumps(data, option=ORJSON_DUMP_OPTIONS, default=str)
+    return json.dumps(data, indent=2, ensure_ascii=False, default=str).encode('utf-8')
+
+
 def save_json_report(data: Dict[str, Any], company_name: str) -> Optional[str]:
     """
     Save analysis data to a JSON file in the reports directory.
@@ -100,8 +133,8 @@ def save_json_report(data: Dict[str, Any], company_name: str) -> Optional[str]:
         }
         
         # Save to JSON file
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(data_with_metadata, f, indent=2, ensure_ascii=False, default=str)
+        with open(file_path, 'wb') as f:
+            f.write(dump_report(data_with_metadata))
         
         logger.info(f"Analysis data saved to: {file_path}")
         return file_path
@@ -122,8 +155,12 @@ def load_json_report(file_path: str) -> Optional[Dict[str, Any]]:
         Optional[Dict[str, Any]]: Loaded data, None if failed
     """
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        if orjson:
+            with open(file_path, 'rb') as f:
+                data = orjson.loads(f.read())
+        else:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
         
         logger.info(f"Analysis data loaded from: {file_path}")
         return data
@@ -133,6 +170,25 @@ def load_json_report(file_path: str) -> Optional[Dict[str, Any]]:
         return None
 
 
+@lru_cache(maxsize=None)
+def get_analyzer_fingerprint() -> str:
+    """
+    Fingerprint the analyzer code so cached analyses can be invalidated.
+    
+    Hashes the name and contents of every module in the multibagger package,
+    so any change to the extractor, calculator or config yields a new value
+    even when __version__ is not bumped.
+    
+    Returns:
+        str: Hex SHA-256 digest
+    """
+    digest = hashlib.sha256()
+    for module_path in sorted(Path(__file__).parent.glob('*.py')):
+        digest.update(module_path.name.encode('utf-8'))
+        digest.update(module_path.read_bytes())
+    return digest.hexdigest()
+
+
 def validate_excel_file(file_path: str) -> bool:
     """
     Validate that an Excel file exists and is accessible.
@@ -3,17 +3,23 @@ Basic test suite for the stock analyzer system.
 """
 
 import pytest
+import itertools
 import os
 import tempfile
 import json
 from unittest.mock import Mock, patch, MagicMock
 import pandas as pd
+import numpy as np
 
 # Import the modules to test
-from src.multibagger.stock_analyzer import StockAnalyzer, analyze_stock_workbook
-from src.multibagger.data_extractor import ExcelDataExtractor
+from src.multibagger.stock_analyzer import StockAnalyzer, analyze_stock_workbook, analyze_stock_workbook_with_data
+from src.multibagger.data_extractor import ExcelDataExtractor, metrics_to_arrays
 from src.multibagger.financial_calculator import FinancialCalculator
-from src.multibagger.utils import validate_excel_file, save_json_report
+from src.multibagger.utils import validate_excel_file, save_json_report, load_json_report, get_analyzer_fingerprint
+from src.multibagger.config import (
+    get_recommendation_from_score, get_ratio_benchmark, get_scoring_threshold,
+    SCORING_FRAMEWORK, OUTPUT_CONFIG, SCORING_CUTOFFS, score_metric, score_metric_array
+)
 
 
 class TestStockAnalyzer:
@@ -134,6 +140,30 @@ class TestExcelDataExtractor:
         row_idx = extractor.find_row_by_label(data, 'Revenue')
         assert row_idx == 1
 
+    def test_metrics_to_arrays(self):
+        """Test the columnar view of an extracted section."""
+        section = {'years': [2022, 2023], 'sales': {2022: 100.0, 2023: 120.5}, 'eps': {2023: 2.0}}
+        years, arrays = metrics_to_arrays(section, dtype=np.float32)
+        assert years.tolist() == [2022, 2023]
+        assert arrays['sales'].dtype == np.float32
+        assert arrays['sales'].tolist() == [100.0, 120.5]
+        assert arrays['eps'].tolist() == [0.0, 2.0]
+
+    def test_load_workbook_parses_sheets_on_access(self):
+        """Test that sheets are listed on load and parsed when first read."""
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            excel_path = os.path.join(tmp_dir, 'test.xlsx')
+            with pd.ExcelWriter(excel_path, engine='openpyxl') as writer:
+                pd.DataFrame({'Narration': ['Sales'], 'Mar-24': [100]}).to_excel(writer, sheet_name='Profit & Loss', index=False)
+                pd.DataFrame({'Notes': ['unused']}).to_excel(writer, sheet_name='Customization', index=False)
+            
+            with ExcelDataExtractor(excel_path) as extractor:
+                assert extractor.load_workbook()
+                assert list(extractor.sheets) == ['Profit & Loss', 'Customization']
+                assert extractor.sheets['Profit & Loss'].iloc[0, 1] == 100
+            # Parsed sheets outlive the closed workbook
+            assert extractor.sheets['Profit & Loss'].iloc[0, 0] == 'Sales'
+
 
 class TestFinancialCalculator:
     """Test cases for FinancialCalculator class."""
@@ -221,6 +251,93 @@ class TestUtilityFunctions:
         assert result is not None
         assert 'Test_Company_analysis_' in result
 
+    def test_json_report_round_trip(self):
+        """Test that a saved report loads back with the same data."""
+        test_data = {'company_info': {'name': 'Test Company', 'market_cap': 380.87},
+                     'historical_data': {'years': [2022, 2023]}}
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            with patch('src.multibagger.utils.get_reports_directory', return_value=tmp_dir):
+                path = save_json_report(test_data, 'Test Company')
+
+            loaded = load_json_report(path)
+
+        assert loaded['company_info'] == test_data['company_info']
+        assert loaded['historical_data'] == test_data['historical_data']
+        assert loaded['analysis_metadata']['file_path'] == path
+
+    def test_get_analyzer_fingerprint(self):
+        """Test that the analyzer fingerprint is a stable SHA-256 hex digest."""
+        fingerprint = get_analyzer_fingerprint()
+        assert len(fingerprint) == 64
+        assert fingerprint == get_analyzer_fingerprint()
+
+
+class TestConfig:
+    """Test cases for configuration helpers."""
+
+    def test_get_recommendation_from_score(self):
+        """Test recommendation tiers at their score boundaries."""
+        assert get_recommendation_from_score(85) == {'recommendation': 'STRONG BUY', 'confidence': 'HIGH'}
+        assert get_recommendation_from_score(70) == {'recommendation': 'STRONG BUY', 'confidence': 'HIGH'}
+        assert get_recommendation_from_score(69) == {'recommendation': 'BUY', 'confidence': 'MEDIUM'}
+        assert get_recommendation_from_score(30) == {'recommendation': 'HOLD', 'confidence': 'MEDIUM'}
+        assert get_recommendation_from_score(0) == {'recommendation': 'AVOID', 'confidence': 'HIGH'}
+        assert get_recommendation_from_score(-5) == {'recommendation': 'AVOID', 'confidence': 'HIGH'}
+
+    def test_benchmark_and_threshold_lookups(self):
+        """Test flattened benchmark and threshold lookups, including misses."""
+        assert get_ratio_benchmark('profitability', 'roe', 'excellent') == 20.0
+        assert get_ratio_benchmark('leverage', 'debt_to_equity', 'poor') == float('inf')
+        assert get_ratio_benchmark('profitability', 'unknown', 'good') == 0.0
+        assert get_scoring_threshold('growth_quality', 'good') == {'min_cagr': 10, 'points': 15}
+        assert get_scoring_threshold('unknown', 'good') == {}
+        with pytest.raises(TypeError):
+            SCORING_FRAMEWORK['valuation'] = {}
+
+    def test_currency_symbol(self):
+        """Test that the currency symbol is the single rupee code point."""
+        assert OUTPUT_CONFIG['currency_symbol'] == '\u20b9'
+        assert len(OUTPUT_CONFIG['currency_symbol']) == 1
+
+    def test_score_metric_array(self):
+        """Test vectorized tier scoring at the threshold boundaries."""
+        growth = score_metric_array('growth_quality', [-1, 4.9, 5, 10, 15, 15.1, float('nan')])
+        assert growth.tolist() == [0, 0, 0, 10, 15, 20, 0]
+        valuation = score_metric_array('valuation', [10, 10, 15, 25.5, 35, 80, float('nan')],
+                                       growth=[12, 10, 12, 12, 12, 12, 12])
+        assert valuation.tolist() == [20, 15, 15, 10, 5, 5, 5]
+        assert [score_metric('growth_quality', v) for v in [-1, 5, 5.1, 10, 15, 15.1]] == [0, 0, 10, 10, 15, 20]
+        assert [score_metric('valuation', v, growth=12) for v in [10, 15, 25, 34.9, 35]] == [20, 15, 10, 10, 5]
+        assert score_metric('valuation', 10, growth=10) == 15
+
+    def test_score_metric_matches_calculator(self):
+        """Test the cutoff scorers against FinancialCalculator at every tier boundary."""
+        cagrs = [-5, 0, 5, 5.1, 10, 10.1, 15, 15.1, float('nan')]
+        margins = [0, 5, 5.1, 10, 15, 15.1, float('nan')]
+        pes = [0, 14.9, 15, 24.9, 25, 35, 80, float('inf'), float('nan')]
+        calculator = FinancialCalculator({})
+        calculator.calculate_leverage_ratios = Mock(return_value={})
+        calculator.calculate_liquidity_ratios = Mock(return_value={})
+        calculator.calculate_cash_flow_ratios = Mock(return_value={})
+        for cagr, npm, pe in itertools.product(cagrs, margins, pes):
+            calculator.calculate_growth_metrics = Mock(return_value={'revenue_cagr_5yr': cagr})
+            calculator.calculate_profitability_ratios = Mock(return_value={'net_profit_margin': npm})
+            calculator.calculate_valuation_ratios = Mock(return_value={'pe_ratio': pe})
+            expected = calculator.calculate_investment_score()['category_scores']
+            assert score_metric('growth_quality', cagr) == expected['growth_quality']
+            assert score_metric('profitability', npm) == expected['profitability']
+            assert score_metric('valuation', pe, growth=cagr) == expected['valuation']
+            assert score_metric_array('valuation', [pe], growth=cagr).tolist() == [expected['valuation']]
+        assert score_metric_array('growth_quality', cagrs).tolist() == [score_metric('growth_quality', c) for c in cagrs]
+        assert score_metric_array('profitability', margins).tolist() == [score_metric('profitability', m) for m in margins]
+
+    def test_scoring_cutoffs_round_trip(self):
+        """Test that the cutoff tables reproduce SCORING_FRAMEWORK."""
+        for category, (key, cutoffs, points, _) in SCORING_CUTOFFS.items():
+            thresholds = SCORING_FRAMEWORK[category]['thresholds'].values()
+            assert sorted(zip(cutoffs, points)) == sorted((t[key], t['points']) for t in thresholds)
+
 
 class TestIntegration:
     """Integration tests."""
@@ -271,6 +388,22 @@ class TestIntegration:
         mock_extractor.extract_all_data.assert_called_once()
         mock_save.assert_called_once()
 
+    @patch('src.multibagger.stock_analyzer.StockAnalyzer')
+    def test_analyze_stock_workbook_with_data(self, mock_analyzer_class):
+        """Test that the analysis data is returned alongside the JSON path."""
+        mock_analyzer = Mock()
+        mock_analyzer.run_complete_analysis.return_value = "/path/to/result.json"
+        mock_analyzer.final_analysis = {'company_info': {'name': 'Test Company'}}
+        mock_analyzer_class.return_value = mock_analyzer
+
+        result = analyze_stock_workbook_with_data("test.xlsx")
+
+        assert result == ("/path/to/result.json", {'company_info': {'name': 'Test Company'}})
+
+        mock_analyzer.run_complete_analysis.return_value = None
+        assert analyze_stock_workbook_with_data("test.xlsx") is None
+        assert analyze_stock_workbook("test.xlsx") is None
+
 
 if __name__ == "__main__":
     pytest.main([__file__])
\ No newline at end of file